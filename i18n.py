@@ -4,7 +4,7 @@ This module provides translations for the UI in multiple languages.
 Currently supports Chinese (zh_CN) and English (en).
 """
 
-from typing import Dict
+from typing import Dict, Iterable
 
 # Chinese translations (default)
 ZH_CN: Dict[str, str] = {
@@ -458,6 +458,18 @@ class I18n:
                 pass
         return text
     
+    def batch(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Get translated texts for several keys in one call.
+        
+        Args:
+            keys: Translation keys
+            
+        Returns:
+            Dict mapping each key to its translated text (or the key itself if not found)
+        """
+        translations = self._translations
+        return {key: translations.get(key, key) for key in keys}
+    
     def __call__(self, key: str, **kwargs) -> str:
         """Shorthand for get().
         
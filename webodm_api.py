@@ -1,22 +1,47 @@
 import requests
+import requests.adapters
 import json
 import os
+import threading
 import time
 import mimetypes
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from typing import Dict, List, Any, Optional, Tuple, Union, Callable
 
+# 预设列表的缓存有效期（秒）
+PRESETS_CACHE_TTL = 60
+
 class WebODMAPI:
     """WebODM API客户端类，用于与WebODM服务器进行交互"""
     
-    def __init__(self, server_url: str = "http://localhost:8000"):
+    def __init__(self, server_url: str = "http://localhost:8000", pool_size: int = 16):
         """初始化WebODM API客户端
         
         Args:
             server_url: WebODM服务器URL，默认为http://localhost:8000
+            pool_size: 连接池大小，应不小于并发请求的线程数，否则多余的连接会被丢弃
         """
         self.server_url = server_url.rstrip('/')
         self.token = None
         self.headers = {}
+        # 复用同一会话以保持HTTP长连接，连接池大小需覆盖并发请求数
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # 任务列表的ETag缓存，{project_id: (etag, tasks)}
+        self._tasks_etag_cache: Dict[int, Tuple[str, List[Dict[str, Any]]]] = {}
+        # 项目列表的ETag缓存，(etag, projects)
+        self._projects_etag_cache: Optional[Tuple[str, List[Dict[str, Any]]]] = None
+        # 预设列表缓存，(获取时间, presets)
+        self._presets_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+    
+    def clear_cache(self):
+        """清空列表响应缓存（切换账号或登出时调用）"""
+        self._tasks_etag_cache.clear()
+        self._projects_etag_cache = None
+        self._presets_cache = None
     
     def authenticate(self, username: str, password: str) -> bool:
         """用户认证，获取JWT令牌
@@ -29,7 +54,7 @@ class WebODMAPI:
             bool: 认证是否成功
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.server_url}/api/token-auth/",
                 data={
                     'username': username,
@@ -42,6 +67,7 @@ class WebODMAPI:
                 self.token = result.get('token')
                 if self.token:
                     self.headers = {'Authorization': f'JWT {self.token}'}
+                    self.clear_cache()
                     return True
             return False
         except Exception as e:
@@ -58,20 +84,33 @@ class WebODMAPI:
             raise Exception("未认证，请先调用authenticate方法")
             
         try:
-            response = requests.get(
+            headers = self.headers
+            cached = self._projects_etag_cache
+            if cached:
+                # 条件请求，项目列表未变化时服务器返回304
+                headers = dict(self.headers, **{'If-None-Match': cached[0]})
+            
+            response = self._session.get(
                 f"{self.server_url}/api/projects/",
-                headers=self.headers
+                headers=headers
             )
             
+            if response.status_code == 304 and cached:
+                return cached[1]
+            
             if response.status_code == 200:
                 result = response.json()
                 # 处理API返回的不同格式
                 if isinstance(result, list):
-                    return result  # 直接返回列表
+                    projects = result  # 直接返回列表
                 elif isinstance(result, dict) and 'results' in result:
-                    return result['results']  # 返回results字段
+                    projects = result['results']  # 返回results字段
                 else:
-                    return []  # 未知格式，返回空列表
+                    projects = []  # 未知格式，返回空列表
+                
+                etag = response.headers.get('ETag')
+                self._projects_etag_cache = (etag, projects) if etag else None
+                return projects
             else:
                 print(f"获取项目失败: {response.status_code}")
                 return []
@@ -92,7 +131,7 @@ class WebODMAPI:
             raise Exception("未认证，请先调用authenticate方法")
             
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.server_url}/api/projects/{project_id}/",
                 headers=self.headers
             )
@@ -124,7 +163,7 @@ class WebODMAPI:
             if description:
                 data['description'] = description
                 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.server_url}/api/projects/",
                 headers=self.headers,
                 data=data
@@ -152,20 +191,36 @@ class WebODMAPI:
             raise Exception("未认证，请先调用authenticate方法")
             
         try:
-            response = requests.get(
+            headers = self.headers
+            cached = self._tasks_etag_cache.get(project_id)
+            if cached:
+                # 条件请求，任务列表未变化时服务器返回304
+                headers = dict(self.headers, **{'If-None-Match': cached[0]})
+            
+            response = self._session.get(
                 f"{self.server_url}/api/projects/{project_id}/tasks/",
-                headers=self.headers
+                headers=headers
             )
             
+            if response.status_code == 304 and cached:
+                return cached[1]
+            
             if response.status_code == 200:
                 result = response.json()
                 # 处理API返回的不同格式
                 if isinstance(result, list):
-                    return result  # 直接返回列表
+                    tasks = result  # 直接返回列表
                 elif isinstance(result, dict) and 'results' in result:
-                    return result['results']  # 返回results字段
+                    tasks = result['results']  # 返回results字段
+                else:
+                    tasks = []  # 未知格式，返回空列表
+                
+                etag = response.headers.get('ETag')
+                if etag:
+                    self._tasks_etag_cache[project_id] = (etag, tasks)
                 else:
-                    return []  # 未知格式，返回空列表
+                    self._tasks_etag_cache.pop(project_id, None)
+                return tasks
             else:
                 print(f"获取任务列表失败: {response.status_code}")
                 return []
@@ -187,7 +242,7 @@ class WebODMAPI:
             raise Exception("未认证，请先调用authenticate方法")
             
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.server_url}/api/projects/{project_id}/tasks/{task_id}/",
                 headers=self.headers
             )
@@ -201,6 +256,25 @@ class WebODMAPI:
             print(f"获取任务详情错误: {str(e)}")
             return None
     
+    def get_tasks_by_ids(self, project_id: int, task_ids: List[Union[int, str]]) -> Dict[str, Dict[str, Any]]:
+        """通过一次任务列表请求批量获取多个任务的信息
+        
+        Args:
+            project_id: 项目ID
+            task_ids: 任务ID列表
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: 任务ID（字符串）到任务信息的映射，列表中不存在的任务不包含在内
+        """
+        wanted = {str(task_id) for task_id in task_ids}
+        if not wanted:
+            return {}
+        return {
+            task_id: task
+            for task in self.get_tasks(project_id)
+            if (task_id := str(task.get('id', ""))) in wanted
+        }
+    
     def create_task(
         self,
         project_id: int,
@@ -211,7 +285,10 @@ class WebODMAPI:
         auto_processing_node: bool = True,
         partial: bool = True,
         align_to: str = "auto",
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        max_upload_workers: int = 8,
+        executor: Optional[Executor] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> Optional[Dict[str, Any]]:
         """创建新任务
         
@@ -225,6 +302,9 @@ class WebODMAPI:
             partial: 是否以分段上传方式创建任务
             align_to: 任务对齐方式
             progress_callback: 上传进度回调函数，参数为(已完成数量, 总数, 状态信息)
+            max_upload_workers: 并发上传图片的最大线程数（未传入 executor 时生效）
+            executor: 用于上传的外部线程池（可选），传入时由调用方负责其生命周期
+            cancel_event: 取消事件（可选），置位后不再等待剩余图片上传并返回None
             
         Returns:
             Optional[Dict[str, Any]]: 创建的任务信息
@@ -262,7 +342,7 @@ class WebODMAPI:
             print("\n\n")
             print(payload["options"])
             
-            response = requests.post(
+            response = self._session.post(
                 f"{self.server_url}/api/projects/{project_id}/tasks/",
                 headers=self.headers,
                 json=payload
@@ -278,20 +358,34 @@ class WebODMAPI:
                 print("Failed to create task: Missing task ID in response")
                 return None
             
+            # 上传为I/O密集型操作，使用有限的线程池并发上传
             uploaded = 0
-            for image_path in valid_images:
-                filename = os.path.basename(image_path)
-                if progress_callback:
-                    progress_callback(uploaded, total_images, f"Uploading {filename}...")
-                
-                success = self.upload_task_image(project_id, task_id, image_path)
-                if not success:
-                    print(f"上传图片失败: {filename}")
-                    return None
-                
-                uploaded += 1
-                if progress_callback:
-                    progress_callback(uploaded, total_images, f"Uploaded {filename}")
+            if executor is None:
+                workers = max(1, min(max_upload_workers, total_images))
+                pool_context = ThreadPoolExecutor(max_workers=workers)
+            else:
+                pool_context = nullcontext(executor)
+            with pool_context as pool:
+                futures = {
+                    pool.submit(self.upload_task_image, project_id, task_id, image_path): image_path
+                    for image_path in valid_images
+                }
+                for future in as_completed(futures):
+                    if cancel_event is not None and cancel_event.is_set():
+                        print("上传已取消")
+                        for pending in futures:
+                            pending.cancel()
+                        return None
+                    filename = os.path.basename(futures[future])
+                    if not future.result():
+                        print(f"上传图片失败: {filename}")
+                        for pending in futures:
+                            pending.cancel()
+                        return None
+                    
+                    uploaded += 1
+                    if progress_callback:
+                        progress_callback(uploaded, total_images, f"Uploaded {filename}")
             
             if progress_callback:
                 progress_callback(total_images, total_images, "Submitting task...")
@@ -337,7 +431,7 @@ class WebODMAPI:
                 data['processing_node'] = processing_node
             data['auto_processing_node'] = 'true' if auto_processing_node else 'false'
             
-            response = requests.post(
+            response = self._session.post(
                 f"{self.server_url}/api/projects/{project_id}/tasks/{task_id}/restart/",
                 headers=self.headers,
                 data=data
@@ -362,7 +456,7 @@ class WebODMAPI:
             raise Exception("未认证，请先调用authenticate方法")
             
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.server_url}/api/projects/{project_id}/tasks/{task_id}/cancel/",
                 headers=self.headers
             )
@@ -386,7 +480,7 @@ class WebODMAPI:
             raise Exception("未认证，请先调用authenticate方法")
             
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.server_url}/api/projects/{project_id}/tasks/{task_id}/remove/",
                 headers=self.headers
             )
@@ -396,7 +490,14 @@ class WebODMAPI:
             print(f"删除任务错误: {str(e)}")
             return False
     
-    def download_asset(self, project_id: int, task_id: Union[int, str], asset: str, output_path: str) -> bool:
+    def download_asset(
+        self,
+        project_id: int,
+        task_id: Union[int, str],
+        asset: str,
+        output_path: str,
+        cancel_event: Optional[threading.Event] = None
+    ) -> bool:
         """下载任务资源
         
         Args:
@@ -404,6 +505,7 @@ class WebODMAPI:
             task_id: 任务ID
             asset: 资源名称，如'orthophoto.tif'
             output_path: 输出文件路径
+            cancel_event: 取消事件（可选），置位后停止下载并删除未完成的文件
             
         Returns:
             bool: 下载是否成功
@@ -412,7 +514,7 @@ class WebODMAPI:
             raise Exception("未认证，请先调用authenticate方法")
             
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.server_url}/api/projects/{project_id}/tasks/{task_id}/download/{asset}",
                 headers=self.headers,
                 stream=True
@@ -425,9 +527,16 @@ class WebODMAPI:
                 # 写入文件
                 with open(output_path, 'wb') as f:
                     for chunk in response.iter_content(chunk_size=8192):
+                        if cancel_event is not None and cancel_event.is_set():
+                            break
                         if chunk:
                             f.write(chunk)
-                return True
+                    else:
+                        return True
+                response.close()
+                os.remove(output_path)
+                print(f"下载已取消: {asset}")
+                return False
             else:
                 print(f"下载资源失败: {response.status_code}")
                 return False
@@ -460,7 +569,7 @@ class WebODMAPI:
             raise Exception("未认证，请先调用authenticate方法")
         
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.server_url}/api/processingnodes/options/",
                 headers=self.headers
             )
@@ -475,7 +584,7 @@ class WebODMAPI:
             return []
 
     def get_presets(self) -> List[Dict[str, Any]]:
-        """获取WebODM的预设配置列表
+        """获取WebODM的预设配置列表，结果缓存 PRESETS_CACHE_TTL 秒
         
         Returns:
             List[Dict[str, Any]]: 预设配置列表，每项包含id、name、options等字段
@@ -483,8 +592,12 @@ class WebODMAPI:
         if not self.token:
             raise Exception("未认证，请先调用authenticate方法")
 
+        cached = self._presets_cache
+        if cached and time.monotonic() - cached[0] < PRESETS_CACHE_TTL:
+            return cached[1]
+
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.server_url}/api/presets/",
                 headers=self.headers
             )
@@ -492,10 +605,14 @@ class WebODMAPI:
             if response.status_code == 200:
                 result = response.json()
                 if isinstance(result, list):
-                    return result
+                    presets = result
                 elif isinstance(result, dict) and 'results' in result:
-                    return result['results']
-                return []
+                    presets = result['results']
+                else:
+                    presets = []
+                if presets:
+                    self._presets_cache = (time.monotonic(), presets)
+                return presets
             else:
                 print(f"获取预设配置失败: {response.status_code}")
                 return []
@@ -517,7 +634,7 @@ class WebODMAPI:
             mime_type = mimetypes.guess_type(image_path)[0] or "application/octet-stream"
             with open(image_path, 'rb') as f:
                 files = {'images': (filename, f, mime_type)}
-                response = requests.post(
+                response = self._session.post(
                     f"{self.server_url}/api/projects/{project_id}/tasks/{task_id}/upload/",
                     headers=self.headers,
                     files=files
@@ -536,7 +653,7 @@ class WebODMAPI:
             raise Exception("未认证，请先调用authenticate方法")
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.server_url}/api/projects/{project_id}/tasks/{task_id}/commit/",
                 headers=self.headers
             )
@@ -552,27 +669,16 @@ class WebODMAPI:
         """将处理选项转换为API需要的列表"""
         if not options:
             return []
-        serialized = []
-        for key, value in options.items():
-            if key is None:
-                continue
-            formatted = self._format_option_value(value)
-            if formatted is None:
-                continue
-            serialized.append({'name': key, 'value': formatted})
-        return serialized
+        format_value = self._format_option_value
+        return [
+            {'name': key, 'value': formatted}
+            for key, value in options.items()
+            if key is not None and (formatted := format_value(value)) is not None
+        ]
     
     def _serialize_options(self, options: Dict[str, Any]) -> str:
         """将处理选项转换为API需要的JSON字符串"""
-        serialized = []
-        for key, value in options.items():
-            if key is None:
-                continue
-            formatted = self._format_option_value(value)
-            if formatted is None:
-                continue
-            serialized.append({'name': key, 'value': formatted})
-        return json.dumps(serialized)
+        return json.dumps(self._build_options_list(options))
 
     def _format_option_value(self, value: Any) -> Optional[str]:
         """将选项的值统一转换为字符串表示"""
@@ -1,34 +1,186 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 import os
+import sys
+import atexit
 import json
+import functools
 import threading
-from typing import Dict, List, Any, Optional, Callable, Union
-from PIL import Image, ImageTk
-import re
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Deque, Dict, List, Any, Optional, Callable, Tuple, Union
 
 from webodm_api import WebODMAPI
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
 from i18n import get_i18n, set_language, t, I18n
 
+# Windows路径中的非法字符替换表（单字符替换用 str.translate 比正则更快）
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# 布尔选项值的文本表示
+_BOOL_VALUES: Dict[str, bool] = {
+    **dict.fromkeys(("1", "true", "yes", "on"), True),
+    **dict.fromkeys(("0", "false", "no", "off", ""), False),
+}
+
+# 视为空值、不发送给服务器的选项值
+_EMPTY_OPTION_VALUES = frozenset({"none", "null", ""})
+
+def _clean_option_str(value: str) -> Optional[str]:
+    """去除选项字符串两端空白，空值返回None
+    
+    Args:
+        value: 选项值
+    Returns:
+        Optional[str]: 清理后的字符串；为空或表示空值时返回None
+    """
+    trimmed = value.strip()
+    return None if trimmed.lower() in _EMPTY_OPTION_VALUES else trimmed
+
+
+@contextmanager
+def _batch_update(widget: tk.Widget):
+    """批量修改控件内容时暂时断开滚动条联动，结束后统一刷新一次
+    
+    Args:
+        widget: 带有 yscrollcommand 选项的控件（Listbox、Text、Treeview 等）
+    """
+    scroll_command = widget.cget("yscrollcommand")
+    widget.configure(yscrollcommand="")
+    try:
+        yield widget
+    finally:
+        widget.configure(yscrollcommand=scroll_command)
+        widget.update_idletasks()
+
+@functools.lru_cache(maxsize=256)
+def _sanitize_cached(name: str) -> str:
+    """清理Windows路径非法字符，同一名称只处理一次
+    
+    Args:
+        name: 原始名称
+    Returns:
+        str: 安全的文件名，最长150个字符
+    """
+    safe = name.translate(_SANITIZE_TABLE).strip().strip('.')
+    return (safe or "task")[:150]
+
+@functools.lru_cache(maxsize=4096)
+def _format_seconds_cached(total_seconds: int) -> str:
+    """将秒数格式化为 'HH:MM:SS'，已完成任务的时长不再变化，刷新时直接命中缓存
+    
+    Args:
+        total_seconds: 总秒数
+    Returns:
+        str: 格式化后的时长
+    """
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+def _fast_parse_utc(utc_str: str) -> Optional[datetime]:
+    """按固定位置切片解析 'YYYY-MM-DDTHH:MM:SS[.ffffff]Z' 格式的UTC时间
+    
+    Args:
+        utc_str: UTC时间字符串
+    Returns:
+        datetime: 带UTC时区的datetime；格式不符时返回None
+    """
+    if len(utc_str) < 20 or utc_str[-1] != 'Z' or utc_str[10] != 'T':
+        return None
+    try:
+        microsecond = 0
+        if utc_str[19] == '.':
+            # 小数秒位数不固定，补齐或截断到6位
+            microsecond = int(utc_str[20:-1][:6].ljust(6, '0'))
+        elif len(utc_str) != 20:
+            return None
+        return datetime(
+            int(utc_str[0:4]), int(utc_str[5:7]), int(utc_str[8:10]),
+            int(utc_str[11:13]), int(utc_str[14:16]), int(utc_str[17:19]),
+            microsecond, tzinfo=timezone.utc
+        )
+    except ValueError:
+        return None
+
+def _parse_utc_to_local(utc_str: str) -> Optional[datetime]:
+    """将UTC时间字符串解析为本地时区的datetime
+    
+    Args:
+        utc_str: UTC时间字符串
+    Returns:
+        datetime: 本地时区的datetime；若解析失败返回None
+    """
+    if not utc_str:
+        return None
+    try:
+        # fromisoformat 比 strptime 快得多，'Z' 后缀需替换为显式偏移
+        dt = datetime.fromisoformat(utc_str.replace('Z', '+00:00'))
+    except ValueError:
+        # 旧版本 Python 的 fromisoformat 不接受非 6 位的小数秒，改用切片解析
+        dt = _fast_parse_utc(utc_str)
+        if dt is None:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    # 不缓存固定的本地时区：astimezone() 需按各自日期处理夏令时
+    return dt.astimezone()
+
+def _canvas_mousewheel(event, canvas) -> None:
+    """按鼠标滚轮方向滚动画布
+    
+    Args:
+        event: 滚轮事件
+        canvas: 需要滚动的画布
+    """
+    try:
+        canvas.yview_scroll(-int(event.delta/120), "units")
+    except Exception:
+        pass
+
+# 按语言缓存的状态映射，切换语言时清空
+_STATUS_MAP_CACHE: Dict[str, Dict[int, str]] = {}
+
+# 状态映射中表示未知状态的键
+STATUS_UNKNOWN_KEY = -1
+
+# 任务状态码：重启后进入队列、已完成、已取消
+STATUS_QUEUED = 10
+STATUS_COMPLETED = 40
+STATUS_CANCELED = 50
 
 def get_status_map() -> Dict[int, str]:
-    """Get status map with translated values."""
-    return {
-        10: t("status_queued"),
-        20: t("status_running"),
-        30: t("status_failed"),
-        40: t("status_completed"),
-        50: t("status_canceled")
-    }
+    """Get status map with translated values (cached per language).
+
+    The translated "unknown" label is stored under STATUS_UNKNOWN_KEY.
+    """
+    lang = get_i18n().language
+    status_map = _STATUS_MAP_CACHE.get(lang)
+    if status_map is None:
+        status_map = {
+            10: t("status_queued"),
+            20: t("status_running"),
+            30: t("status_failed"),
+            40: t("status_completed"),
+            50: t("status_canceled"),
+            STATUS_UNKNOWN_KEY: t("status_unknown"),
+        }
+        _STATUS_MAP_CACHE[lang] = status_map
+    return status_map
+
+# 版本号缓存文件，内容为 pyproject.toml 的修改时间与版本号
+_VERSION_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".webodm_client", ".version_cache")
 
+@functools.lru_cache(maxsize=1)
 def _read_project_version() -> str:
     """读取项目版本号
     
     功能:
         从与本文件同目录的 `pyproject.toml` 中解析并返回 `project.version` 字段，
-        如果解析失败则返回空字符串。
+        如果解析失败则返回空字符串。结果会连同 pyproject.toml 的修改时间
+        缓存到 `~/.webodm_client/.version_cache`，文件未变化时不再解析 TOML。
     传入参数:
         无
     返回值:
@@ -37,8 +189,18 @@ def _read_project_version() -> str:
     try:
         base_dir = os.path.dirname(os.path.abspath(__file__))
         toml_path = os.path.join(base_dir, "pyproject.toml")
-        if not os.path.exists(toml_path):
+        try:
+            toml_mtime = repr(os.stat(toml_path).st_mtime)
+        except OSError:
             return ""
+        # pyproject.toml 未修改时直接使用缓存的版本号，免去 TOML 解析
+        try:
+            with open(_VERSION_CACHE_PATH, "r", encoding="utf-8") as f:
+                cached_mtime, cached_version = f.read().split("\n", 1)
+            if cached_mtime == toml_mtime and cached_version:
+                return cached_version
+        except Exception:
+            pass
         # Python 3.11+ 自带 tomllib，旧版用 tomli
         try:
             import tomllib
@@ -48,15 +210,144 @@ def _read_project_version() -> str:
             import tomli
             with open(toml_path, "rb") as f:
                 data = tomli.load(f)
-        return str(data.get("project", {}).get("version", ""))
+        version = str(data.get("project", {}).get("version", ""))
+        if version:
+            try:
+                os.makedirs(os.path.dirname(_VERSION_CACHE_PATH), exist_ok=True)
+                with open(_VERSION_CACHE_PATH, "w", encoding="utf-8") as f:
+                    f.write(f"{toml_mtime}\n{version}")
+            except Exception:
+                pass
+        return version
     except Exception:
         return ""
 
 VERSION = _read_project_version() or "1.3.1"
 
+# 各界面构建方法一次性获取的翻译键
+_MENU_KEYS = (
+    "menu_exit",
+    "menu_file",
+    "menu_server_settings",
+    "lang_zh_cn",
+    "lang_en",
+    "menu_language",
+    "menu_settings",
+    "menu_about",
+    "menu_help",
+)
+_CONNECTION_FRAME_KEYS = (
+    "server_connection",
+    "server_address",
+    "login",
+    "logout",
+    "status",
+    "not_connected",
+)
+_PROJECTS_FRAME_KEYS = (
+    "project_list",
+    "refresh",
+    "new_project",
+    "view_details",
+)
+_TASKS_FRAME_KEYS = (
+    "task_list",
+    "refresh",
+    "new_task",
+    "download_assets",
+    "restart_tasks",
+    "cancel_tasks",
+    "delete_tasks",
+    "view_details",
+    "col_id",
+    "col_name",
+    "col_created_at",
+    "col_status",
+    "col_processing_time",
+)
+_TASK_DETAILS_KEYS = (
+    "task_details",
+    "unnamed",
+    "basic_info",
+    "col_id",
+    "col_name",
+    "col_created_at",
+    "col_status",
+    "col_processing_time",
+    "available_assets",
+    "processing_options",
+    "close",
+    "download_assets",
+)
+_STATUS_BAR_KEYS = (
+    "ready",
+)
+
+def _id_key(task: Dict[str, Any]) -> str:
+    """任务ID排序键"""
+    return str(task.get('id', 0))
+
+def _name_key(task: Dict[str, Any]) -> str:
+    """任务名称排序键（不区分大小写）"""
+    return str(task.get('name', "")).lower()
+
+def _status_key(task: Dict[str, Any]) -> int:
+    """任务状态排序键，按状态码即生命周期顺序排列"""
+    return task.get('status') or 0
+
+def _processing_time_key(task: Dict[str, Any]) -> int:
+    """处理时长排序键，无法解析时视为 0"""
+    try:
+        return int(task.get('processing_time') or 0)
+    except Exception:
+        return 0
+
+def _field_key(column: str, task: Dict[str, Any]) -> str:
+    """未单独定义排序键的列，按字段的字符串值排序"""
+    return str(task.get(column, ""))
+
+# 任务表格各列的排序键（创建时间列使用预计算的时间戳，单独处理）
+_TASK_SORT_KEYS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "id": _id_key,
+    "name": _name_key,
+    "status": _status_key,
+    "processing_time": _processing_time_key,
+}
+
+# 配置保存的合并延迟（毫秒）
+CONFIG_SAVE_DELAY_MS = 500
+
+# 主线程处理界面更新队列的轮询间隔（毫秒）
+UI_POLL_MS = 50
+
+# 进度日志保留的最大行数，超出部分从顶部删除
+PROGRESS_MAX_LINES = 500
+
+# 批量操作后变化的任务超过该比例时重新加载整个任务列表，否则只更新受影响的行
+TASK_PATCH_MAX_RATIO = 0.25
+
+# 批量任务操作时对服务器的最大并发请求数
+API_MAX_WORKERS = 16
+
+# 后台操作线程池的线程数，仅用于登录、加载列表、任务操作等短时操作
+IO_MAX_WORKERS = 4
+
+# 上传/下载线程池的线程数，长时间传输不占用短时操作的线程
+TRANSFER_MAX_WORKERS = 4
+
+# 图片上传线程池的线程数，所有新建任务的图片上传共用
+UPLOAD_MAX_WORKERS = 8
+
 class WebODMClientUI:
     """WebODM客户端UI类，使用Tkinter实现用户界面"""
     
+    # 任务列表中各列的索引
+    TASK_COL_ID = 0
+    TASK_COL_NAME = 1
+    TASK_COL_STATUS = 3
+    # 隐藏列，保存原始状态码，比较状态时无需依赖翻译文本
+    TASK_COL_STATUS_CODE = 5
+    
     def __init__(self, root: tk.Tk):
         """初始化UI界面
         
@@ -66,9 +357,52 @@ class WebODMClientUI:
         self.root = root
         self.root.geometry("1000x700")
         self.root.minsize(800, 600)
+        # 当前显示忙碌光标的窗口，用于拦截重复提交
+        self._busy_widgets: set = set()
+        # 屏幕尺寸只查询一次，供对话框居中使用
+        self._screen_size: Tuple[int, int] = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
         
         # 创建API客户端
-        self.api = WebODMAPI()
+        # 连接池需同时容纳各线程池的并发请求
+        self.api = WebODMAPI(pool_size=API_MAX_WORKERS + IO_MAX_WORKERS + TRANSFER_MAX_WORKERS + UPLOAD_MAX_WORKERS)
+        
+        # 工作线程提交给主线程执行的界面更新队列，由 _drain_ui_queue 定时统一处理
+        self._ui_queue: "queue.SimpleQueue[Tuple[Callable[..., Any], tuple]]" = queue.SimpleQueue()
+        self.root.after(UI_POLL_MS, self._drain_ui_queue)
+        
+        # 后台操作线程池，避免每次操作都创建新线程
+        self._executor = ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix="webodm-io")
+        
+        # 上传/下载线程池，与短时操作分开，传输进行中时刷新和登录不必排队等待
+        self._transfer_executor = ThreadPoolExecutor(max_workers=TRANSFER_MAX_WORKERS, thread_name_prefix="webodm-transfer")
+        
+        # 图片上传线程池，大量图片排队上传时不会阻塞批量任务操作使用的API线程池
+        self._upload_executor = ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS, thread_name_prefix="webodm-upload")
+        
+        # 批量任务操作共享的API请求线程池，限制对服务器的并发请求数
+        # 与后台操作线程池分开，避免后台操作等待子请求时占满线程导致死锁
+        self._api_executor = ThreadPoolExecutor(max_workers=API_MAX_WORKERS, thread_name_prefix="webodm-api")
+        # 关闭窗口时置位，进行中的上传/下载在处理下一个文件前检查并退出
+        self._closing = threading.Event()
+        # 线程池的关闭由 on_close 负责：解释器退出时会先等待工作线程结束，atexit 中再关闭已无作用
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # 可复用的进度对话框缓存
+        self._progress_dialogs: Dict[str, tuple] = {}
+        
+        # 已选图片列表及用于快速去重的集合
+        self.image_paths: List[str] = []
+        self._image_paths_set: set = set()
+        
+        # 预设缓存
+        self._preset_name_map: Optional[Dict[str, Dict[str, Any]]] = None
+        self._preset_names: List[str] = []
+        self._default_preset_name = ""
+        self._presets_source: Optional[List[Dict[str, Any]]] = None
+        self._preset_text_cache: Dict[Any, str] = {}
+        self._preset_options_cache: Dict[Any, Dict[str, Any]] = {}
+        # 可复用的预设选择对话框（单个及批量重启共用）
+        self._preset_dialog: Optional[Dict[str, Any]] = None
         
         # 创建配置文件夹
         self.config_dir = os.path.join(os.path.expanduser("~"), ".webodm_client")
@@ -76,6 +410,9 @@ class WebODMClientUI:
         
         # 加载配置
         self.config = self.load_config()
+        self._save_after: Optional[str] = None
+        # 退出时写入尚未落盘的配置
+        atexit.register(lambda: self._save_after is not None and self._flush_config())
         
         # 设置语言
         self.i18n = get_i18n()
@@ -117,39 +454,69 @@ class WebODMClientUI:
         return {}
     
     def save_config(self):
-        """保存配置文件"""
+        """保存配置文件
+        
+        写入会延迟 CONFIG_SAVE_DELAY_MS 毫秒执行，期间的多次保存合并为一次写入。
+        """
+        if self._save_after is not None:
+            try:
+                self.root.after_cancel(self._save_after)
+            except Exception:
+                pass
+        self._save_after = self.root.after(CONFIG_SAVE_DELAY_MS, self._flush_config)
+    
+    def _flush_config(self):
+        """立即将配置写入磁盘（先写临时文件再原子替换）"""
+        self._save_after = None
         config_path = os.path.join(self.config_dir, "config.json")
+        tmp_path = config_path + ".tmp"
         try:
-            with open(config_path, 'w') as f:
+            with open(tmp_path, 'w') as f:
                 json.dump(self.config, f)
+            os.replace(tmp_path, config_path)
         except Exception as e:
             print(f"Error saving config file: {str(e)}")
     
+    def on_close(self):
+        """关闭主窗口：取消排队中的后台操作，写入未保存的配置后销毁窗口
+        
+        已开始的操作无法强行中断：上传/下载会在当前文件或数据块完成后停止，
+        其他短时操作执行完当前请求后结束，进程在这些线程退出后才会结束。
+        """
+        self._closing.set()
+        for executor in (self._executor, self._transfer_executor, self._upload_executor, self._api_executor):
+            executor.shutdown(wait=False, cancel_futures=True)
+        if self._save_after is not None:
+            self.root.after_cancel(self._save_after)
+            self._flush_config()
+        self.root.destroy()
+    
     def create_menu(self):
         """创建菜单栏"""
+        L = self.i18n.batch(_MENU_KEYS)
         self.menu_bar = tk.Menu(self.root)
         
         # 文件菜单
         file_menu = tk.Menu(self.menu_bar, tearoff=0)
-        file_menu.add_command(label=t("menu_exit"), command=self.root.quit)
-        self.menu_bar.add_cascade(label=t("menu_file"), menu=file_menu)
+        file_menu.add_command(label=L["menu_exit"], command=self.on_close)
+        self.menu_bar.add_cascade(label=L["menu_file"], menu=file_menu)
         
         # 设置菜单
         settings_menu = tk.Menu(self.menu_bar, tearoff=0)
-        settings_menu.add_command(label=t("menu_server_settings"), command=self.show_server_settings)
+        settings_menu.add_command(label=L["menu_server_settings"], command=self.show_server_settings)
         
         # 语言子菜单
         language_menu = tk.Menu(settings_menu, tearoff=0)
-        language_menu.add_command(label=t("lang_zh_cn"), command=lambda: self.change_language("zh_CN"))
-        language_menu.add_command(label=t("lang_en"), command=lambda: self.change_language("en"))
-        settings_menu.add_cascade(label=t("menu_language"), menu=language_menu)
+        language_menu.add_command(label=L["lang_zh_cn"], command=lambda: self.change_language("zh_CN"))
+        language_menu.add_command(label=L["lang_en"], command=lambda: self.change_language("en"))
+        settings_menu.add_cascade(label=L["menu_language"], menu=language_menu)
         
-        self.menu_bar.add_cascade(label=t("menu_settings"), menu=settings_menu)
+        self.menu_bar.add_cascade(label=L["menu_settings"], menu=settings_menu)
         
         # 帮助菜单
         help_menu = tk.Menu(self.menu_bar, tearoff=0)
-        help_menu.add_command(label=t("menu_about"), command=self.show_about)
-        self.menu_bar.add_cascade(label=t("menu_help"), menu=help_menu)
+        help_menu.add_command(label=L["menu_about"], command=self.show_about)
+        self.menu_bar.add_cascade(label=L["menu_help"], menu=help_menu)
         
         self.root.config(menu=self.menu_bar)
     
@@ -160,6 +527,7 @@ class WebODMClientUI:
             language: 语言代码 (zh_CN 或 en)
         """
         set_language(language)
+        _STATUS_MAP_CACHE.clear()
         self.config['language'] = language
         self.save_config()
         
@@ -186,33 +554,34 @@ class WebODMClientUI:
     
     def create_connection_frame(self):
         """创建连接框架"""
-        connection_frame = ttk.LabelFrame(self.main_frame, text=t("server_connection"), padding="10")
+        L = self.i18n.batch(_CONNECTION_FRAME_KEYS)
+        connection_frame = ttk.LabelFrame(self.main_frame, text=L["server_connection"], padding="10")
         connection_frame.pack(fill=tk.X, pady=(0, 10))
         
         # 服务器地址
         server_frame = ttk.Frame(connection_frame)
         server_frame.pack(fill=tk.X, pady=5)
         
-        ttk.Label(server_frame, text=t("server_address")).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Label(server_frame, text=L["server_address"]).pack(side=tk.LEFT, padx=(0, 5))
         
         self.server_url_var = tk.StringVar(value="http://localhost:8000")
         server_entry = ttk.Entry(server_frame, textvariable=self.server_url_var, width=40)
         server_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         
         # 登录按钮
-        self.login_button = ttk.Button(server_frame, text=t("login"), command=self.login)
+        self.login_button = ttk.Button(server_frame, text=L["login"], command=self.login)
         self.login_button.pack(side=tk.LEFT, padx=5)
         
-        self.logout_button = ttk.Button(server_frame, text=t("logout"), command=self.logout, state=tk.DISABLED)
+        self.logout_button = ttk.Button(server_frame, text=L["logout"], command=self.logout, state=tk.DISABLED)
         self.logout_button.pack(side=tk.LEFT)
         
         # 登录状态
         status_frame = ttk.Frame(connection_frame)
         status_frame.pack(fill=tk.X, pady=5)
         
-        ttk.Label(status_frame, text=t("status")).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Label(status_frame, text=L["status"]).pack(side=tk.LEFT, padx=(0, 5))
         
-        self.login_status_var = tk.StringVar(value=t("not_connected"))
+        self.login_status_var = tk.StringVar(value=L["not_connected"])
         ttk.Label(status_frame, textvariable=self.login_status_var).pack(side=tk.LEFT)
     
     def create_projects_tasks_frame(self):
@@ -229,16 +598,17 @@ class WebODMClientUI:
     
     def create_projects_frame(self):
         """创建项目框架"""
-        projects_frame = ttk.LabelFrame(self.paned_window, text=t("project_list"))
+        L = self.i18n.batch(_PROJECTS_FRAME_KEYS)
+        projects_frame = ttk.LabelFrame(self.paned_window, text=L["project_list"])
         self.paned_window.add(projects_frame, weight=1)
         
         # 项目工具栏
         projects_toolbar = ttk.Frame(projects_frame)
         projects_toolbar.pack(fill=tk.X, pady=5, padx=5)
         
-        ttk.Button(projects_toolbar, text=t("refresh"), command=self.load_projects).pack(side=tk.LEFT, padx=2)
-        ttk.Button(projects_toolbar, text=t("new_project"), command=self.create_new_project).pack(side=tk.LEFT, padx=2)
-        ttk.Button(projects_toolbar, text=t("view_details"), command=self.view_project_details).pack(side=tk.LEFT, padx=2)
+        ttk.Button(projects_toolbar, text=L["refresh"], command=self.load_projects).pack(side=tk.LEFT, padx=2)
+        ttk.Button(projects_toolbar, text=L["new_project"], command=self.create_new_project).pack(side=tk.LEFT, padx=2)
+        ttk.Button(projects_toolbar, text=L["view_details"], command=self.view_project_details).pack(side=tk.LEFT, padx=2)
         
         # 项目列表
         projects_list_frame = ttk.Frame(projects_frame)
@@ -261,20 +631,21 @@ class WebODMClientUI:
     
     def create_tasks_frame(self):
         """创建任务框架"""
-        tasks_frame = ttk.LabelFrame(self.paned_window, text=t("task_list"))
+        L = self.i18n.batch(_TASKS_FRAME_KEYS)
+        tasks_frame = ttk.LabelFrame(self.paned_window, text=L["task_list"])
         self.paned_window.add(tasks_frame, weight=2)
         
         # 任务工具栏
         tasks_toolbar = ttk.Frame(tasks_frame)
         tasks_toolbar.pack(fill=tk.X, pady=5, padx=5)
         
-        ttk.Button(tasks_toolbar, text=t("refresh"), command=self.load_tasks).pack(side=tk.LEFT, padx=2)
-        ttk.Button(tasks_toolbar, text=t("new_task"), command=self.create_new_task).pack(side=tk.LEFT, padx=2)
-        ttk.Button(tasks_toolbar, text=t("download_assets"), command=self.download_assets).pack(side=tk.LEFT, padx=2)
-        ttk.Button(tasks_toolbar, text=t("restart_tasks"), command=self.restart_tasks).pack(side=tk.LEFT, padx=2)
-        ttk.Button(tasks_toolbar, text=t("cancel_tasks"), command=self.cancel_tasks).pack(side=tk.LEFT, padx=2)
-        ttk.Button(tasks_toolbar, text=t("delete_tasks"), command=self.remove_tasks).pack(side=tk.LEFT, padx=2)
-        ttk.Button(tasks_toolbar, text=t("view_details"), command=self.on_task_double_click).pack(side=tk.LEFT, padx=2)
+        ttk.Button(tasks_toolbar, text=L["refresh"], command=self.load_tasks).pack(side=tk.LEFT, padx=2)
+        ttk.Button(tasks_toolbar, text=L["new_task"], command=self.create_new_task).pack(side=tk.LEFT, padx=2)
+        ttk.Button(tasks_toolbar, text=L["download_assets"], command=self.download_assets).pack(side=tk.LEFT, padx=2)
+        ttk.Button(tasks_toolbar, text=L["restart_tasks"], command=self.restart_tasks).pack(side=tk.LEFT, padx=2)
+        ttk.Button(tasks_toolbar, text=L["cancel_tasks"], command=self.cancel_tasks).pack(side=tk.LEFT, padx=2)
+        ttk.Button(tasks_toolbar, text=L["delete_tasks"], command=self.remove_tasks).pack(side=tk.LEFT, padx=2)
+        ttk.Button(tasks_toolbar, text=L["view_details"], command=self.on_task_double_click).pack(side=tk.LEFT, padx=2)
         
         # 任务列表
         tasks_list_frame = ttk.Frame(tasks_frame)
@@ -288,17 +659,18 @@ class WebODMClientUI:
         scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
         
         # 创建任务表格
-        columns = ("id", "name", "created_at", "status", "processing_time")
+        columns = ("id", "name", "created_at", "status", "processing_time", "status_code")
         self.tasks_treeview = ttk.Treeview(tasks_list_frame, columns=columns, show="headings",
+                                          displaycolumns=columns[:self.TASK_COL_STATUS_CODE],
                                           xscrollcommand=scrollbar_x.set,
                                           yscrollcommand=scrollbar_y.set)
         
         # 设置列标题
-        self.tasks_treeview.heading("id", text=t("col_id"), command=lambda: self.sort_tasks_by("id"))
-        self.tasks_treeview.heading("name", text=t("col_name"), command=lambda: self.sort_tasks_by("name"))
-        self.tasks_treeview.heading("created_at", text=t("col_created_at"), command=lambda: self.sort_tasks_by("created_at"))
-        self.tasks_treeview.heading("status", text=t("col_status"), command=lambda: self.sort_tasks_by("status"))
-        self.tasks_treeview.heading("processing_time", text=t("col_processing_time"), command=lambda: self.sort_tasks_by("processing_time"))
+        self.tasks_treeview.heading("id", text=L["col_id"], command=lambda: self.sort_tasks_by("id"))
+        self.tasks_treeview.heading("name", text=L["col_name"], command=lambda: self.sort_tasks_by("name"))
+        self.tasks_treeview.heading("created_at", text=L["col_created_at"], command=lambda: self.sort_tasks_by("created_at"))
+        self.tasks_treeview.heading("status", text=L["col_status"], command=lambda: self.sort_tasks_by("status"))
+        self.tasks_treeview.heading("processing_time", text=L["col_processing_time"], command=lambda: self.sort_tasks_by("processing_time"))
         
         # 设置列宽
         self.tasks_treeview.column("id", width=50)
@@ -317,16 +689,23 @@ class WebODMClientUI:
         
         # 任务数据
         self.tasks_data = []
+        self._tasks_by_id: Dict[str, Dict[str, Any]] = {}
+        # 最近一次排序的列及其结果列表，用于同列切换方向时直接反转
+        self._last_sort: Optional[Tuple[str, List[Dict[str, Any]]]] = None
+        self._iid_to_task_id: Dict[str, str] = {}
+        # 创建时间字符串 -> (本地时间字符串, 时间戳)，排序和刷新时复用
+        self._created_display_cache: Dict[str, Tuple[str, float]] = {}
         self.current_project_id = None
         self.tasks_sort_state = {"id": True, "name": True, "created_at": True, "status": True, "processing_time": True}
     
     def create_status_bar(self):
         """创建状态栏"""
+        L = self.i18n.batch(_STATUS_BAR_KEYS)
         self.status_bar = ttk.Frame(self.root, relief=tk.SUNKEN, padding=(2, 2))
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
         self.status_var = tk.StringVar()
-        self.status_var.set(t("ready"))
+        self.status_var.set(L["ready"])
         status_label = ttk.Label(self.status_bar, textvariable=self.status_var, anchor=tk.W)
         status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
     
@@ -338,6 +717,73 @@ class WebODMClientUI:
             self.server_url_var.set(server_url)
             self.config['server_url'] = server_url
             self.save_config()
+            self.api.clear_cache()
+            self._invalidate_presets()
+    
+    def _post_ui(self, func: Callable[..., Any], *args: Any):
+        """从任意线程提交一个在主线程执行的界面更新
+        
+        Args:
+            func: 需要在主线程调用的函数
+            args: 调用参数
+        """
+        self._ui_queue.put((func, args))
+    
+    def _drain_ui_queue(self):
+        """在主线程中执行所有待处理的界面更新，并调度下一次处理"""
+        # 先调度下一次处理：队列中的回调可能弹出模态对话框，
+        # 对话框打开期间其嵌套事件循环仍会继续处理其他工作线程提交的更新
+        self.root.after(UI_POLL_MS, self._drain_ui_queue)
+        get = self._ui_queue.get_nowait
+        try:
+            while True:
+                func, args = get()
+                try:
+                    func(*args)
+                except Exception as e:
+                    print(f"Error updating UI: {str(e)}")
+        except queue.Empty:
+            pass
+    
+    def _end_action(self, status: str):
+        """结束一次后台操作：恢复光标并写入最终状态，由工作线程完成时统一提交一次
+        
+        Args:
+            status: 状态栏显示的结果文本
+        """
+        self._set_busy(False)
+        self.status_var.set(status)
+    
+    def _set_busy(self, busy: bool, *widgets: tk.Misc):
+        """切换主窗口及相关对话框的忙碌光标
+        
+        Args:
+            busy: True 显示等待光标，False 恢复默认光标
+            widgets: 需要同步切换光标的其他窗口
+        """
+        cursor = "wait" if busy else ""
+        for widget in (self.root,) + widgets:
+            try:
+                widget.config(cursor=cursor)
+            except tk.TclError:
+                # 窗口已被关闭
+                pass
+            if busy:
+                self._busy_widgets.add(widget)
+            else:
+                self._busy_widgets.discard(widget)
+    
+    def _centered_geometry(self, width: int, height: int) -> str:
+        """生成在屏幕居中的几何字符串
+        
+        Args:
+            width: 窗口宽度
+            height: 窗口高度
+        Returns:
+            str: 形如 'WxH+X+Y' 的几何字符串
+        """
+        screen_width, screen_height = self._screen_size
+        return f"{width}x{height}+{(screen_width - width) // 2}+{(screen_height - height) // 2}"
     
     def show_about(self):
         """显示关于对话框"""
@@ -345,21 +791,18 @@ class WebODMClientUI:
     
     def login(self):
         """登录WebODM服务器"""
-        server_url = self.server_url_var.set(self.server_url_var.get().rstrip('/'))
-        self.api.server_url = self.server_url_var.get()
+        url = self.server_url_var.get().rstrip('/')
+        self.server_url_var.set(url)
+        self.api.server_url = url
         
         # 创建登录对话框
         login_dialog = tk.Toplevel(self.root)
         login_dialog.title(t("login_title"))
-        login_dialog.geometry("300x150")
+        # 尺寸固定，直接计算居中位置，无需 update_idletasks 测量
+        login_dialog.geometry(self._centered_geometry(300, 150))
         login_dialog.resizable(False, False)
         login_dialog.transient(self.root)
         login_dialog.grab_set()
-        # 将对话框居中显示
-        login_dialog.update_idletasks()
-        x = (login_dialog.winfo_screenwidth() - login_dialog.winfo_width()) // 2
-        y = (login_dialog.winfo_screenheight() - login_dialog.winfo_height()) // 2
-        login_dialog.geometry(f"+{x}+{y}")
         
         ttk.Label(login_dialog, text=t("username")).grid(row=0, column=0, padx=10, pady=10, sticky=tk.W)
         username_var = tk.StringVar()
@@ -374,28 +817,29 @@ class WebODMClientUI:
             username = username_var.get()
             password = password_var.get()
             
+            if login_dialog in self._busy_widgets:
+                return
             if not username or not password:
                 messagebox.showerror(t("error"), t("error_empty_credentials"))
                 return
             
             self.status_var.set(t("logging_in"))
-            login_dialog.config(cursor="wait")
-            self.root.config(cursor="wait")
+            self._set_busy(True, login_dialog)
+            
+            def finish_login(success: bool):
+                # 配置只在主线程中修改，after_login 中统一保存
+                if success:
+                    self.config['username'] = username
+                    self.config['password'] = password
+                self.after_login(success, login_dialog)
             
             def login_thread():
                 success = self.api.authenticate(username, password)
-                if success:
-                    try:
-                        self.config['username'] = username
-                        self.config['password'] = password
-                        self.save_config()
-                    except Exception:
-                        pass
                 
                 # 在主线程中更新UI
-                self.root.after(0, lambda: self.after_login(success, login_dialog))
+                self._post_ui(finish_login, success)
             
-            threading.Thread(target=login_thread).start()
+            self._executor.submit(login_thread)
         
         ttk.Button(login_dialog, text=t("login"), command=do_login).grid(row=2, column=0, columnspan=2, pady=10)
         
@@ -414,12 +858,12 @@ class WebODMClientUI:
             success: 登录是否成功
             login_dialog: 登录对话框
         """
-        self.root.config(cursor="")
-        login_dialog.config(cursor="")
+        self._set_busy(False, login_dialog)
         
         if success:
             self.status_var.set(t("login_success"))
             login_dialog.destroy()
+            self._invalidate_presets()
             
             # 保存配置
             self.config['server_url'] = self.api.server_url
@@ -439,6 +883,8 @@ class WebODMClientUI:
         """注销登录"""
         self.api.token = None
         self.api.headers = {}
+        self.api.clear_cache()
+        self._invalidate_presets()
         
         # 更新配置
         if 'token' in self.config:
@@ -454,6 +900,8 @@ class WebODMClientUI:
         
         self.tasks_treeview.delete(*self.tasks_treeview.get_children())
         self.tasks_data = []
+        self._tasks_by_id = {}
+        self._iid_to_task_id = {}
         self.current_project_id = None
         
         self.status_var.set(t("logged_out"))
@@ -480,15 +928,15 @@ class WebODMClientUI:
             return
         
         self.status_var.set(t("loading_projects"))
-        self.root.config(cursor="wait")
+        self._set_busy(True)
         
         def load_thread():
             projects = self.api.get_projects()
             
             # 在主线程中更新UI
-            self.root.after(0, lambda: self.update_projects_list(projects))
+            self._post_ui(self.update_projects_list, projects)
         
-        threading.Thread(target=load_thread).start()
+        self._executor.submit(load_thread)
     
     def update_projects_list(self, projects: List[Dict[str, Any]]):
         """更新项目列表
@@ -496,15 +944,16 @@ class WebODMClientUI:
         Args:
             projects: 项目列表
         """
-        self.root.config(cursor="")
+        self._set_busy(False)
         
         # 清空列表
         self.projects_listbox.delete(0, tk.END)
         self.projects_data = projects
         
-        # 添加项目
-        for project in projects:
-            self.projects_listbox.insert(tk.END, f"{project['name']}")
+        # 添加项目（一次 Tcl 调用插入全部名称）
+        names = [f"{project['name']}" for project in projects]
+        if names:
+            self.projects_listbox.insert(tk.END, *names)
         
         self.status_var.set(t("projects_loaded", count=len(projects)))
     
@@ -521,6 +970,9 @@ class WebODMClientUI:
         index = selection[0]
         if index < len(self.projects_data):
             project = self.projects_data[index]
+            if project['id'] != self.current_project_id:
+                # 切换项目时丢弃上一个项目的创建时间缓存，避免缓存随项目切换无限增长
+                self._created_display_cache.clear()
             self.current_project_id = project['id']
             
             # 加载任务列表
@@ -535,7 +987,7 @@ class WebODMClientUI:
         # 创建项目对话框
         project_dialog = tk.Toplevel(self.root)
         project_dialog.title(t("new_project_title"))
-        project_dialog.geometry("400x200")
+        project_dialog.geometry(self._centered_geometry(400, 200))
         project_dialog.resizable(False, False)
         project_dialog.transient(self.root)
         project_dialog.grab_set()
@@ -552,21 +1004,22 @@ class WebODMClientUI:
             name = name_var.get()
             description = description_var.get()
             
+            if project_dialog in self._busy_widgets:
+                return
             if not name:
                 messagebox.showerror(t("error"), t("error_empty_project_name"))
                 return
             
             self.status_var.set(t("creating_project"))
-            project_dialog.config(cursor="wait")
-            self.root.config(cursor="wait")
+            self._set_busy(True, project_dialog)
             
             def create_thread():
                 project = self.api.create_project(name, description)
                 
                 # 在主线程中更新UI
-                self.root.after(0, lambda: self.after_create_project(project, project_dialog))
+                self._post_ui(self.after_create_project, project, project_dialog)
             
-            threading.Thread(target=create_thread).start()
+            self._executor.submit(create_thread)
         
         ttk.Button(project_dialog, text=t("create"), command=do_create).grid(row=2, column=0, columnspan=2, pady=10)
         
@@ -580,8 +1033,7 @@ class WebODMClientUI:
             project: 创建的项目信息
             project_dialog: 项目对话框
         """
-        self.root.config(cursor="")
-        project_dialog.config(cursor="")
+        self._set_busy(False, project_dialog)
         
         if project:
             self.status_var.set(t("project_created"))
@@ -611,16 +1063,16 @@ class WebODMClientUI:
             
             # 显示加载状态
             self.status_var.set(t("getting_project_details"))
-            self.root.config(cursor="wait")
+            self._set_busy(True)
             
             def load_thread():
                 # 获取详细的项目信息
                 project = self.api.get_project(project_id)
                 
                 # 在主线程中更新UI
-                self.root.after(0, lambda: self.show_project_details(project))
+                self._post_ui(self.show_project_details, project)
             
-            threading.Thread(target=load_thread).start()
+            self._executor.submit(load_thread)
     
     def show_project_details(self, project: Optional[Dict[str, Any]]):
         """显示项目详细信息
@@ -628,7 +1080,7 @@ class WebODMClientUI:
         Args:
             project: 项目详细信息
         """
-        self.root.config(cursor="")
+        self._set_busy(False)
         self.status_var.set(t("ready"))
         
         if not project:
@@ -638,7 +1090,7 @@ class WebODMClientUI:
         # 创建项目详情对话框
         details_dialog = tk.Toplevel(self.root)
         details_dialog.title(f"{t('project_details')}: {project['name']}")
-        details_dialog.geometry("600x300")
+        details_dialog.geometry(self._centered_geometry(600, 300))
         details_dialog.transient(self.root)
         details_dialog.grab_set()
             
@@ -661,26 +1113,7 @@ class WebODMClientUI:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        def _on_mousewheel_restart_single(event):
-            try:
-                canvas.yview_scroll(-int(event.delta/120), "units")
-            except Exception:
-                pass
-        canvas.bind("<MouseWheel>", _on_mousewheel_restart_single)
-        
-        def _on_mousewheel_restart_batch(event):
-            try:
-                canvas.yview_scroll(-int(event.delta/120), "units")
-            except Exception:
-                pass
-        canvas.bind("<MouseWheel>", _on_mousewheel_restart_batch)
-        
-        def _on_mousewheel_project(event):
-            try:
-                canvas.yview_scroll(-int(event.delta/120), "units")
-            except Exception:
-                pass
-        canvas.bind("<MouseWheel>", _on_mousewheel_project)
+        canvas.bind("<MouseWheel>", lambda e, c=canvas: _canvas_mousewheel(e, c))
         
         # 显示项目详情
         row = 0
@@ -704,17 +1137,8 @@ class WebODMClientUI:
         # 创建时间
         ttk.Label(scrollable_frame, text=t("created_at"), font=("TkDefaultFont", 10, "bold")).grid(row=row, column=0, sticky=tk.W, padx=5, pady=5)
         # 获取创建时间并转换为本地时间
-        created_at = project.get('created_at', t("unknown"))
-        if created_at != t("unknown"):
-            try:
-                # 将UTC时间字符串转换为datetime对象
-                utc_time = datetime.strptime(created_at, '%Y-%m-%dT%H:%M:%S.%fZ')
-                utc_time = utc_time.replace(tzinfo=pytz.UTC)
-                # 转换为本地时间
-                local_time = utc_time.astimezone()
-                created_at = local_time.strftime('%Y-%m-%d %H:%M:%S')
-            except Exception:
-                pass
+        created_at = project.get('created_at')
+        created_at = self._format_to_local_time(created_at) if created_at else t("unknown")
         ttk.Label(scrollable_frame, text=created_at).grid(row=row, column=1, sticky=tk.W, padx=5, pady=5)
         row += 1
         
@@ -742,15 +1166,15 @@ class WebODMClientUI:
             return
         
         self.status_var.set(t("loading_tasks"))
-        self.root.config(cursor="wait")
+        self._set_busy(True)
         
         def load_thread():
             tasks = self.api.get_tasks(self.current_project_id)
             
             # 在主线程中更新UI
-            self.root.after(0, lambda: self.update_tasks_list(tasks))
+            self._post_ui(self.update_tasks_list, tasks)
         
-        threading.Thread(target=load_thread).start()
+        self._executor.submit(load_thread)
     
     def update_tasks_list(self, tasks: List[Dict[str, Any]]):
         """更新任务列表
@@ -758,33 +1182,50 @@ class WebODMClientUI:
         Args:
             tasks: 任务列表
         """
-        self.root.config(cursor="")
+        self._set_busy(False)
+        
+        # 数据未变化时无需重建表格
+        if tasks == self.tasks_data and self.tasks_treeview.get_children():
+            self.status_var.set(t("tasks_loaded", count=len(tasks)))
+            return
         
-        # 清空表格
-        self.tasks_treeview.delete(*self.tasks_treeview.get_children())
         self.tasks_data = tasks
+        self._tasks_by_id = {str(task.get('id', "")): task for task in tasks}
+        self._iid_to_task_id = {}
         
         status_map = get_status_map()
-        
-        # 添加任务
-        for task in tasks:
-            status = status_map.get(task.get('status', 0), t("status_unknown"))
-            processing_time = "-"
-            if task.get('processing_time'):
-                total_seconds = int(task.get('processing_time') / 1000)
-                hours = total_seconds // 3600
-                minutes = (total_seconds % 3600) // 60
-                seconds = total_seconds % 60
-                processing_time = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            created_local = self._format_to_local_time(task.get('created_at', ""))
-            
-            self.tasks_treeview.insert("", tk.END, values=(
-                task.get('id', ""),
-                task.get('name', t("unnamed")),
+        status_unknown = status_map[STATUS_UNKNOWN_KEY]
+        unnamed = t("unnamed")
+        # 循环内使用局部变量，省去全局与属性查找
+        get = dict.get
+        status_get = status_map.get
+        
+        # 先完成所有格式化，再统一插入表格
+        rows = [
+            (
+                get(task, 'id', ""),
+                get(task, 'name', unnamed),
                 created_local,
-                status,
-                processing_time
-            ))
+                status_get(status := get(task, 'status') or 0, status_unknown),
+                processing_time,
+                status
+            )
+            for task, (created_local, _, processing_time) in zip(tasks, self._precompute_task_display(tasks))
+        ]
+        
+        # 清空和插入期间将表格从布局中移除并暂停滚动条同步，避免逐行重绘
+        treeview = self.tasks_treeview
+        insert = treeview.insert
+        end = tk.END
+        iid_to_task_id = self._iid_to_task_id
+        with _batch_update(treeview):
+            treeview.pack_forget()
+            try:
+                treeview.delete(*treeview.get_children())
+                for row in rows:
+                    iid_to_task_id[insert("", end, values=row)] = str(row[0])
+            finally:
+                treeview.pack(fill=tk.BOTH, expand=True)
         
         self.status_var.set(t("tasks_loaded", count=len(tasks)))
 
@@ -797,26 +1238,23 @@ class WebODMClientUI:
             无
         """
         ascending = self.tasks_sort_state.get(column, True)
-        status_map = get_status_map()
-        def key_func(task: Dict[str, Any]):
-            if column == "id":
-                return str(task.get('id', 0))
-            if column == "name":
-                return str(task.get('name', "")).lower()
+        tasks = self.tasks_data
+        last_sort = self._last_sort
+        if last_sort is not None and last_sort[0] == column and last_sort[1] is tasks:
+            # 数据未变化、只是切换同一列的排序方向，直接反转上次的结果
+            sorted_tasks = tasks[::-1]
+        else:
+            # 先一次性计算所有排序键，再按键对下标排序
             if column == "created_at":
-                dt = self._parse_utc_to_local_dt(task.get('created_at', ""))
-                return dt.timestamp() if dt else 0.0
-            if column == "status":
-                return str(status_map.get(task.get('status', 0), "")).lower()
-            if column == "processing_time":
-                try:
-                    return int(task.get('processing_time', 0))
-                except Exception:
-                    return 0
-            return str(task.get(column, ""))
-        sorted_tasks = sorted(self.tasks_data, key=key_func, reverse=not ascending)
+                keys = [display[1] for display in self._precompute_task_display(tasks)]
+            else:
+                key_func = _TASK_SORT_KEYS.get(column) or functools.partial(_field_key, column)
+                keys = list(map(key_func, tasks))
+            order = sorted(range(len(tasks)), key=keys.__getitem__, reverse=not ascending)
+            sorted_tasks = [tasks[i] for i in order]
         self.tasks_sort_state[column] = not ascending
         self.update_tasks_list(sorted_tasks)
+        self._last_sort = (column, sorted_tasks)
 
     def _parse_utc_to_local_dt(self, utc_str: str) -> Optional[datetime]:
         """将UTC时间字符串解析并转换为本地时区的datetime
@@ -826,17 +1264,36 @@ class WebODMClientUI:
         Returns:
             datetime: 本地时区的datetime；若解析失败返回None
         """
-        if not utc_str:
+        if not isinstance(utc_str, str):
             return None
-        try:
-            dt = datetime.strptime(utc_str, '%Y-%m-%dT%H:%M:%S.%fZ')
-        except Exception:
-            try:
-                dt = datetime.strptime(utc_str, '%Y-%m-%dT%H:%M:%SZ')
-            except Exception:
-                return None
-        dt = dt.replace(tzinfo=pytz.UTC)
-        return dt.astimezone()
+        return _parse_utc_to_local(utc_str)
+
+    def _precompute_task_display(self, tasks: List[Dict[str, Any]]) -> List[Tuple[str, float, str]]:
+        """预先计算任务的显示字段，供表格填充与排序复用
+        
+        Args:
+            tasks: 任务列表
+        Returns:
+            List[Tuple[str, float, str]]: 与 tasks 一一对应的 (本地创建时间, 创建时间戳, 处理时长) 元组
+        """
+        cache = self._created_display_cache
+        cache_get = cache.get
+        parse = self._parse_utc_to_local_dt
+        format_duration = self._format_duration
+        result = []
+        append = result.append
+        for task in tasks:
+            created_at = task.get('created_at', "")
+            created = cache_get(created_at)
+            if created is None:
+                dt = parse(created_at)
+                if dt:
+                    created = (dt.strftime('%Y-%m-%d %H:%M:%S'), dt.timestamp())
+                else:
+                    created = (str(created_at or ""), 0.0)
+                cache[created_at] = created
+            append((created[0], created[1], format_duration(task.get('processing_time'))))
+        return result
 
     def _format_to_local_time(self, utc_str: str) -> str:
         """将UTC时间字符串格式化为本地时间字符串 'YYYY-MM-DD HH:MM:SS'
@@ -851,6 +1308,18 @@ class WebODMClientUI:
             return str(utc_str or "")
         return dt.strftime('%Y-%m-%d %H:%M:%S')
     
+    def _format_duration(self, ms: Optional[Union[int, float]]) -> str:
+        """将毫秒时长格式化为 'HH:MM:SS'
+        
+        Args:
+            ms: 时长（毫秒）
+        Returns:
+            str: 格式化后的时长；为空、为0或为负数（服务器以 -1 表示尚未开始）时返回 '-'
+        """
+        if not ms or ms < 0:
+            return "-"
+        return _format_seconds_cached(int(ms) // 1000)
+    
     def on_task_double_click(self, *args):
         """任务双击事件处理
         
@@ -861,16 +1330,9 @@ class WebODMClientUI:
         if not item:
             return
         
-        item = item[0]
-        task_id = self.tasks_treeview.item(item, "values")[0]
-        
-        # 查找任务数据
-        task = None
-        for t in self.tasks_data:
-            if str(t.get('id', "")) == task_id:
-                task = t
-                break
+        task_id = self._iid_to_task_id.get(item[0])
         
+        task = self._tasks_by_id.get(task_id)
         if task:
             self.show_task_details(task)
     
@@ -880,11 +1342,12 @@ class WebODMClientUI:
         Args:
             task: 任务信息
         """
+        L = self.i18n.batch(_TASK_DETAILS_KEYS)
         status_map = get_status_map()
         
         # 创建任务详情对话框
         details_dialog = tk.Toplevel(self.root)
-        details_dialog.title(f"{t('task_details')} - {task.get('name', t('unnamed'))}")
+        details_dialog.title(f"{L['task_details']} - {task.get('name', L['unnamed'])}")
         details_dialog.geometry("600x400")
         details_dialog.transient(self.root)
         
@@ -894,50 +1357,60 @@ class WebODMClientUI:
         
         # 基本信息选项卡
         info_frame = ttk.Frame(notebook, padding=10)
-        notebook.add(info_frame, text=t("basic_info"))
+        notebook.add(info_frame, text=L["basic_info"])
         
         # 显示基本信息
-        row = 0
-        for label, value in [
-            (t("col_id"), task.get('id', "")),
-            (t("col_name"), task.get('name', t("unnamed"))),
-            (t("col_created_at"), self._format_to_local_time(task.get('created_at', ""))),
-            (t("col_status"), status_map.get(task.get('status', 0), t("status_unknown"))),
-            (t("col_processing_time"), f"{int(task.get('processing_time', 0)/1000//3600):02d}:{int((task.get('processing_time', 0)/1000%3600)//60):02d}:{int((task.get('processing_time', 0)/1000)%60):02d}" if task.get('processing_time') else "-"),
-            (t("available_assets"), "\n".join(task.get('available_assets', [])))
-        ]:
-            ttk.Label(info_frame, text=f"{label}:", font=("TkDefaultFont", 10, "bold")).grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
-            ttk.Label(info_frame, text=str(value)).grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
-            row += 1
+        info_rows = [
+            (L["col_id"], task.get('id', "")),
+            (L["col_name"], task.get('name', L["unnamed"])),
+            (L["col_created_at"], self._format_to_local_time(task.get('created_at', ""))),
+            (L["col_status"], status_map.get(task.get('status', 0), status_map[STATUS_UNKNOWN_KEY])),
+            (L["col_processing_time"], self._format_duration(task.get('processing_time'))),
+            (L["available_assets"], "\n".join(task.get('available_assets', [])))
+        ]
+        self._render_details_rows(info_frame, info_rows)
         
         # 选项选项卡
         if 'options' in task and task['options']:
             options_frame = ttk.Frame(notebook, padding=10)
-            notebook.add(options_frame, text=t("processing_options"))
+            notebook.add(options_frame, text=L["processing_options"])
             
             # 显示选项
-            row = 0
-            for option in task['options']:
-                name = option.get('name', "")
-                value = option.get('value', "")
-                ttk.Label(options_frame, text=f"{name}:", font=("TkDefaultFont", 10, "bold")).grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
-                ttk.Label(options_frame, text=str(value)).grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
-                row += 1
+            option_rows = [(option.get('name', ""), option.get('value', "")) for option in task['options']]
+            self._render_details_rows(options_frame, option_rows)
         
         # 按钮框架
         button_frame = ttk.Frame(details_dialog)
         button_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        ttk.Button(button_frame, text=t("close"), command=details_dialog.destroy).pack(side=tk.RIGHT)
+        ttk.Button(button_frame, text=L["close"], command=details_dialog.destroy).pack(side=tk.RIGHT)
         
         # 如果任务已完成，添加下载按钮
-        if task.get('status') == 40 and task.get('available_assets'):
+        if task.get('status') == STATUS_COMPLETED and task.get('available_assets'):
             ttk.Button(
                 button_frame,
-                text=t("download_assets"),
+                text=L["download_assets"],
                 command=lambda: self.download_assets(task['id'])
             ).pack(side=tk.RIGHT, padx=5)
     
+    def _render_details_rows(self, parent: tk.Widget, rows: List[tuple]):
+        """将"标签: 值"行渲染到单个只读文本框中
+        
+        Args:
+            parent: 父容器
+            rows: (标签, 值) 元组列表
+        """
+        text = tk.Text(parent, wrap="word", height=10, width=60)
+        text.tag_configure("b", font=("TkDefaultFont", 10, "bold"))
+        scrollbar = ttk.Scrollbar(parent, command=text.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text.config(yscrollcommand=scrollbar.set)
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        for label, value in rows:
+            text.insert(tk.END, f"{label}: ", "b")
+            text.insert(tk.END, f"{value}\n")
+        text.config(state="disabled")
+    
     def create_new_task(self):
         """创建新任务
         
@@ -991,6 +1464,7 @@ class WebODMClientUI:
         scrollbar.config(command=images_listbox.yview)
         
         image_paths: List[str] = []
+        image_paths_set: set = set()
         
         # 按钮框架
         buttons_frame = ttk.Frame(main_frame)
@@ -1007,14 +1481,16 @@ class WebODMClientUI:
             filenames = filedialog.askopenfilenames(title=t("select_images_title"), filetypes=filetypes)
             if not filenames:
                 return
-            for filename in filenames:
-                if filename not in image_paths:
-                    image_paths.append(filename)
-                    images_listbox.insert(tk.END, os.path.basename(filename))
+            new_files = [filename for filename in dict.fromkeys(filenames) if filename not in image_paths_set]
+            if not new_files:
+                return
+            image_paths.extend(new_files)
+            image_paths_set.update(new_files)
+            with _batch_update(images_listbox):
+                images_listbox.insert(tk.END, *map(os.path.basename, new_files))
             try:
                 if task_name_var.get().strip() == "":
-                    first_file = filenames[0]
-                    folder_name = os.path.basename(os.path.dirname(first_file))
+                    folder_name = os.path.basename(os.path.dirname(new_files[0]))
                     if folder_name:
                         task_name_var.set(folder_name)
             except Exception:
@@ -1024,10 +1500,11 @@ class WebODMClientUI:
             if not selection:
                 return
             for index in sorted(selection, reverse=True):
-                del image_paths[index]
+                image_paths_set.discard(image_paths.pop(index))
                 images_listbox.delete(index)
         def clear_images():
             image_paths.clear()
+            image_paths_set.clear()
             images_listbox.delete(0, tk.END)
         ttk.Button(buttons_frame, text=t("add_images"), command=add_images).pack(side=tk.LEFT, padx=2)
         ttk.Button(buttons_frame, text=t("remove_selected"), command=remove_selected_images).pack(side=tk.LEFT, padx=2)
@@ -1039,10 +1516,7 @@ class WebODMClientUI:
         preset_frame = ttk.Frame(main_frame)
         preset_frame.grid(row=5, column=0, columnspan=2, sticky=tk.NSEW, padx=5, pady=5)
 
-        presets = self.api.get_presets()
-        preset_name_map = {p.get('name', f"preset_{p.get('id')}"): p for p in presets} if presets else {}
-        preset_names = list(preset_name_map.keys())
-        default_preset_name = next((name for name in preset_names if name.lower() == 'default'), preset_names[0] if preset_names else '')
+        preset_name_map, preset_names, default_preset_name = self._get_preset_map()
 
         selected_preset_var = tk.StringVar(value=default_preset_name)
         ttk.Label(preset_frame, text=t("preset")).pack(side=tk.LEFT, padx=(0, 5))
@@ -1055,17 +1529,21 @@ class WebODMClientUI:
         details_text = tk.Text(details_container, height=10, width=60)
         details_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
+        # 最近一次渲染的预设名称，重复选择同一预设时不再重绘
+        last_rendered = [None]
+
         def render_preset_details():
-            details_text.config(state="normal")
-            details_text.delete("1.0", tk.END)
             name = selected_preset_var.get()
-            preset = preset_name_map.get(name)
-            if preset and isinstance(preset.get('options'), list):
-                for opt in preset['options']:
-                    oname = str(opt.get('name'))
-                    oval = opt.get('value')
-                    details_text.insert(tk.END, f"{oname} = {oval}\n")
-            details_text.config(state="disabled")
+            if name == last_rendered[0]:
+                return
+            last_rendered[0] = name
+            with _batch_update(details_text):
+                details_text.config(state="normal")
+                details_text.delete("1.0", tk.END)
+                preset = preset_name_map.get(name)
+                if preset:
+                    details_text.insert(tk.END, self._preset_details_text(preset))
+                details_text.config(state="disabled")
 
         preset_select.bind("<<ComboboxSelected>>", lambda e: render_preset_details())
         render_preset_details()
@@ -1093,12 +1571,7 @@ class WebODMClientUI:
             if not preset:
                 messagebox.showerror(t("error"), t("error_invalid_preset"))
                 return
-            options = {}
-            for opt in preset.get('options', []):
-                oname = opt.get('name')
-                if not oname:
-                    continue
-                options[oname] = opt.get('value')
+            options = self._preset_options(preset)
             
             self.status_var.set(t("creating_task"))
             total_images = max(len(image_paths), 1)
@@ -1117,7 +1590,7 @@ class WebODMClientUI:
                     else:
                         upload_count_var.set("")
                     upload_status_var.set(message)
-                self.root.after(0, _update)
+                self._post_ui(_update)
             
             def create_thread():
                 task_name = task_name_var.get().strip()
@@ -1128,7 +1601,9 @@ class WebODMClientUI:
                         image_paths,
                         options,
                         name=task_name if task_name else None,
-                        progress_callback=update_upload_progress
+                        progress_callback=update_upload_progress,
+                        executor=self._upload_executor,
+                        cancel_event=self._closing
                     )
                 except Exception as exc:
                     print(f"Error creating task: {exc}")
@@ -1142,9 +1617,9 @@ class WebODMClientUI:
                         else:
                             self.status_var.set(t("task_create_failed"))
                             messagebox.showerror(t("task_create_failed"), t("task_create_failed_msg"))
-                    self.root.after(0, finish)
+                    self._post_ui(finish)
             
-            threading.Thread(target=create_thread).start()
+            self._transfer_executor.submit(create_thread)
         
         ttk.Button(button_frame, text=t("cancel"), command=task_dialog.destroy).pack(side=tk.RIGHT, padx=5)
         ttk.Button(button_frame, text=t("create_task"), command=do_create).pack(side=tk.RIGHT)
@@ -1164,15 +1639,17 @@ class WebODMClientUI:
         if not filenames:
             return
         
-        for filename in filenames:
-            if filename not in self.image_paths:
-                self.image_paths.append(filename)
-                self.images_listbox.insert(tk.END, os.path.basename(filename))
+        new_files = [filename for filename in dict.fromkeys(filenames) if filename not in self._image_paths_set]
+        if not new_files:
+            return
+        self.image_paths.extend(new_files)
+        self._image_paths_set.update(new_files)
+        with _batch_update(self.images_listbox):
+            self.images_listbox.insert(tk.END, *map(os.path.basename, new_files))
         
         try:
             if hasattr(self, 'task_name_var') and self.task_name_var.get().strip() == "":
-                first_file = filenames[0]
-                folder_name = os.path.basename(os.path.dirname(first_file))
+                folder_name = os.path.basename(os.path.dirname(new_files[0]))
                 if folder_name:
                     self.task_name_var.set(folder_name)
         except Exception:
@@ -1186,12 +1663,13 @@ class WebODMClientUI:
         
         # 从后往前删除，避免索引变化
         for index in sorted(selection, reverse=True):
-            del self.image_paths[index]
+            self._image_paths_set.discard(self.image_paths.pop(index))
             self.images_listbox.delete(index)
     
     def clear_images(self):
         """清空图片列表"""
         self.image_paths = []
+        self._image_paths_set = set()
         self.images_listbox.delete(0, tk.END)
     
     def after_create_task(self, task: Optional[Dict[str, Any]], task_dialog: tk.Toplevel):
@@ -1201,8 +1679,7 @@ class WebODMClientUI:
             task: 创建的任务信息
             task_dialog: 任务对话框
         """
-        self.root.config(cursor="")
-        task_dialog.config(cursor="")
+        self._set_busy(False, task_dialog)
         
         if task:
             self.status_var.set(t("task_created"))
@@ -1230,7 +1707,7 @@ class WebODMClientUI:
             if not selection:
                 messagebox.showerror(t("error"), t("error_no_task_selected"))
                 return
-            collected_ids = [str(self.tasks_treeview.item(item, "values")[0]) for item in selection]
+            collected_ids = [self._iid_to_task_id[item] for item in selection]
         else:
             if isinstance(task_ids, (int, str)):
                 collected_ids = [str(task_ids)]
@@ -1238,12 +1715,7 @@ class WebODMClientUI:
                 collected_ids = [str(tid) for tid in task_ids if tid is not None]
         
         # 去重并保持顺序
-        normalized_ids: List[str] = []
-        seen_ids = set()
-        for task_id in collected_ids:
-            if task_id not in seen_ids:
-                normalized_ids.append(task_id)
-                seen_ids.add(task_id)
+        normalized_ids: List[str] = list(dict.fromkeys(collected_ids))
         
         if not normalized_ids:
             messagebox.showerror(t("error"), t("error_no_task_selected"))
@@ -1302,14 +1774,46 @@ class WebODMClientUI:
         
         ttk.Label(asset_dialog, text=t("select_asset_types")).pack(pady=(10, 5))
         
-        asset_vars: Dict[str, tk.BooleanVar] = {}
-        for asset in asset_choices:
-            var = tk.BooleanVar(value=asset in default_selected)
-            asset_vars[asset] = var
-            ttk.Checkbutton(asset_dialog, text=asset, variable=var).pack(anchor=tk.W, padx=20, pady=2)
+        if len(asset_choices) > 20:
+            # 资源较多时使用单个Treeview模拟复选列表，避免逐个创建Checkbutton和BooleanVar
+            checked_assets = set(default_selected).intersection(asset_choices)
+            list_frame = ttk.Frame(asset_dialog)
+            list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=2)
+            asset_tree = ttk.Treeview(list_frame, columns=("sel", "asset"), show="headings", height=10)
+            asset_tree.heading("sel", text="")
+            asset_tree.heading("asset", text=t("available_assets"))
+            asset_tree.column("sel", width=30, stretch=False, anchor=tk.CENTER)
+            asset_tree.column("asset", width=220)
+            tree_scrollbar = ttk.Scrollbar(list_frame, command=asset_tree.yview)
+            tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            asset_tree.config(yscrollcommand=tree_scrollbar.set)
+            asset_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            for asset in asset_choices:
+                asset_tree.insert("", tk.END, iid=asset, values=("☑" if asset in checked_assets else "☐", asset))
+            
+            def toggle_asset(event):
+                asset = asset_tree.identify_row(event.y)
+                if not asset:
+                    return
+                if asset in checked_assets:
+                    checked_assets.discard(asset)
+                    asset_tree.set(asset, "sel", "☐")
+                else:
+                    checked_assets.add(asset)
+                    asset_tree.set(asset, "sel", "☑")
+            
+            asset_tree.bind("<Button-1>", toggle_asset)
+            get_selected_assets = lambda: [asset for asset in asset_choices if asset in checked_assets]
+        else:
+            asset_vars: Dict[str, tk.BooleanVar] = {}
+            for asset in asset_choices:
+                var = tk.BooleanVar(value=asset in default_selected)
+                asset_vars[asset] = var
+                ttk.Checkbutton(asset_dialog, text=asset, variable=var).pack(anchor=tk.W, padx=20, pady=2)
+            get_selected_assets = lambda: [asset for asset, var in asset_vars.items() if var.get()]
         
         def do_download():
-            selected_assets = [asset for asset, var in asset_vars.items() if var.get()]
+            selected_assets = get_selected_assets()
             if not selected_assets:
                 messagebox.showerror(t("error"), t("error_no_task_selected"))
                 return
@@ -1317,472 +1821,648 @@ class WebODMClientUI:
             asset_dialog.destroy()
             
             self.status_var.set(t("preparing_download"))
-            self.root.config(cursor="wait")
-            
-            progress_dialog = tk.Toplevel(self.root)
-            progress_dialog.title(t("download_progress"))
-            progress_dialog.geometry("400x300")
-            progress_dialog.transient(self.root)
-            
-            progress_frame = ttk.Frame(progress_dialog, padding=10)
-            progress_frame.pack(fill=tk.BOTH, expand=True)
+            self._set_busy(True)
             
-            progress_text = tk.Text(progress_frame, height=15, width=50)
-            progress_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            progress_dialog, progress_text, close_button = self._get_progress_dialog("download", t("download_progress"))
             
-            scrollbar = ttk.Scrollbar(progress_frame, command=progress_text.yview)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            progress_text.config(yscrollcommand=scrollbar.set)
+            update_progress = self._make_progress_writer(progress_text)
             
-            close_button = ttk.Button(progress_dialog, text=t("close"), state=tk.DISABLED)
-            close_button.pack(pady=10)
-            
-            def update_progress(text: str):
-                self.root.after(0, lambda: progress_text.insert(tk.END, text))
-                self.root.after(0, lambda: progress_text.see(tk.END))
+            title_prefix = t('download_progress')
             
             def update_progress_title(completed: int, total: int):
-                self.root.after(0, lambda: progress_dialog.title(f"{t('download_progress')} ({completed}/{total})"))
+                # 大批量时每完成约1%才更新一次标题
+                if completed != total and completed % max(1, total // 100):
+                    return
+                self._post_ui(progress_dialog.title, f"{title_prefix} ({completed}/{total})")
             
             def download_thread():
                 total_downloads = len(normalized_ids) * len(selected_assets)
                 completed_downloads = 0
                 failed_downloads = 0
+                sanitize = self._sanitize_filename
+                project_id = self.current_project_id
+                closing = self._closing
+                # 循环外取一次翻译模板，逐个资源只做格式化
+                L = self.i18n.batch(('error_no_task_info', 'task_no_asset', 'downloading_asset', 'download_success', 'download_failed'))
+                fmt_no_info = L['error_no_task_info'] + "\n"
+                fmt_no_asset = L['task_no_asset'] + "\n"
+                fmt_downloading = L['downloading_asset'] + "\n"
+                fmt_success = L['download_success'] + "\n"
+                fmt_failed = L['download_failed'] + "\n"
                 
-                for task_id in normalized_ids:
-                    # 复用已获取的任务信息
-                    task_info = task_info_cache.get(task_id)
-                    if not task_info:
-                        task_info = self.api.get_task(self.current_project_id, task_id)
-                        if task_info:
-                            task_info_cache[task_id] = task_info
-                    
-                    if not task_info:
-                        update_progress(f"{t('error_no_task_info', task_id=task_id)}\n")
-                        continue
-                    
-                    task_name = task_info.get('name', f"task_{task_id}")
-                    available_assets = task_info.get('available_assets', [])
-                    
-                    safe_task_dir = os.path.join(
-                        base_download_dir,
-                        f"{self._sanitize_filename(task_name)}_{self._sanitize_filename(str(task_id))}"
-                    )
-                    
-                    try:
-                        os.makedirs(safe_task_dir, exist_ok=True)
-                    except OSError as exc:
-                        update_progress(f"{t('error_create_dir', dir=safe_task_dir, error=str(exc))}\n")
-                        failed_downloads += len(selected_assets)
-                        completed_downloads += len(selected_assets)
-                        update_progress_title(completed_downloads, total_downloads)
-                        continue
+                status = t("ready")
+                try:
+                    # 并发预取尚未获取的任务信息，避免逐个任务串行请求
+                    missing_ids = [task_id for task_id in normalized_ids if task_id not in task_info_cache]
+                    if missing_ids:
+                        # 先用一次任务列表请求批量获取，列表中缺失的任务再逐个并发请求
+                        task_info_cache.update(self.api.get_tasks_by_ids(project_id, missing_ids))
+                        missing_ids = [task_id for task_id in missing_ids if task_id not in task_info_cache]
+                    if missing_ids:
+                        get_task = self.api.get_task
+                        fetched = self._api_executor.map(lambda tid: get_task(project_id, tid), missing_ids)
+                        for task_id, info in zip(missing_ids, fetched):
+                            if info:
+                                task_info_cache[task_id] = info
                     
-                    for asset in selected_assets:
-                        if asset not in available_assets:
-                            update_progress(f"{t('task_no_asset', task_id=task_id, task_name=task_name, asset=asset)}\n")
-                            failed_downloads += 1
-                            completed_downloads += 1
-                            update_progress_title(completed_downloads, total_downloads)
+                    for task_id in normalized_ids:
+                        if closing.is_set():
+                            return
+                        task_info = task_info_cache.get(task_id)
+                        if not task_info:
+                            update_progress(fmt_no_info.format(task_id=task_id))
                             continue
                         
-                        update_progress(f"{t('downloading_asset', task_id=task_id, task_name=task_name, asset=asset)}\n")
+                        task_name = task_info.get('name', f"task_{task_id}")
+                        available_assets = task_info.get('available_assets', [])
                         
-                        safe_asset_name = self._sanitize_filename(asset)
-                        output_path = os.path.join(safe_task_dir, safe_asset_name)
-                        success = self.api.download_asset(self.current_project_id, task_id, asset, output_path)
+                        safe_task_dir_name = f"{sanitize(task_name)}_{sanitize(str(task_id))}"
+                        safe_task_dir = os.path.join(base_download_dir, safe_task_dir_name)
                         
-                        if success:
-                            update_progress(f"{t('download_success', path=output_path)}\n")
-                        else:
-                            update_progress(f"{t('download_failed', asset=asset)}\n")
-                            failed_downloads += 1
+                        try:
+                            os.makedirs(safe_task_dir, exist_ok=True)
+                        except OSError as exc:
+                            update_progress(f"{t('error_create_dir', dir=safe_task_dir, error=str(exc))}\n")
+                            failed_downloads += len(selected_assets)
+                            completed_downloads += len(selected_assets)
+                            update_progress_title(completed_downloads, total_downloads)
+                            continue
                         
-                        completed_downloads += 1
-                        update_progress_title(completed_downloads, total_downloads)
-                
-                update_progress(f"\n{t('download_complete', total=total_downloads, success=total_downloads - failed_downloads, failed=failed_downloads)}\n")
-                self.root.after(0, lambda: self.root.config(cursor=""))
-                self.root.after(0, lambda: self.status_var.set(t("download_complete_status")))
-                self.root.after(0, lambda: close_button.config(state=tk.NORMAL, command=progress_dialog.destroy))
+                        for asset in selected_assets:
+                            if closing.is_set():
+                                return
+                            if asset not in available_assets:
+                                update_progress(fmt_no_asset.format(task_id=task_id, task_name=task_name, asset=asset))
+                                failed_downloads += 1
+                                completed_downloads += 1
+                                update_progress_title(completed_downloads, total_downloads)
+                                continue
+                            
+                            update_progress(fmt_downloading.format(task_id=task_id, task_name=task_name, asset=asset))
+                            
+                            safe_asset_name = sanitize(asset)
+                            output_path = os.path.join(safe_task_dir, safe_asset_name)
+                            success = self.api.download_asset(project_id, task_id, asset, output_path, cancel_event=closing)
+                            
+                            if success:
+                                update_progress(fmt_success.format(path=output_path))
+                            else:
+                                update_progress(fmt_failed.format(asset=asset))
+                                failed_downloads += 1
+                            
+                            completed_downloads += 1
+                            update_progress_title(completed_downloads, total_downloads)
+                    
+                    update_progress(f"\n{t('download_complete', total=total_downloads, success=total_downloads - failed_downloads, failed=failed_downloads)}\n")
+                    status = t("download_complete_status")
+                finally:
+                    # 无论成功或出错都恢复光标并允许关闭进度对话框
+                    self._post_ui(self._end_action, status)
+                    self._post_ui(close_button.config, {"state": tk.NORMAL})
             
-            threading.Thread(target=download_thread).start()
+            self._transfer_executor.submit(download_thread)
         
         ttk.Button(asset_dialog, text=t("download"), command=do_download).pack(pady=10)
     
+    def _get_preset_map(self) -> Tuple[Dict[str, Dict[str, Any]], List[str], str]:
+        """获取预设名称到预设的映射、名称列表及默认预设名称
+        
+        预设列表由API客户端按有效期缓存，只有其返回新的列表时才重新构建映射。
+        
+        Returns:
+            Tuple[Dict[str, Dict[str, Any]], List[str], str]: (预设名称映射, 预设名称列表, 默认预设名称)；获取失败时均为空
+        """
+        presets = self.api.get_presets()
+        if self._preset_name_map is None or presets is not self._presets_source:
+            if not presets:
+                # 刷新失败时沿用过期的缓存
+                if self._preset_name_map is not None:
+                    return self._preset_name_map, self._preset_names, self._default_preset_name
+                return {}, [], ""
+            # 单次遍历同时构建映射、名称列表及不区分大小写的名称索引
+            name_map: Dict[str, Dict[str, Any]] = {}
+            names: List[str] = []
+            lower_index: Dict[str, str] = {}
+            for preset in presets:
+                name = preset.get('name') or f"preset_{preset.get('id')}"
+                if name not in name_map:
+                    names.append(name)
+                    lower_index.setdefault(name.lower(), name)
+                name_map[name] = preset
+            names.sort(key=str.lower)
+            self._preset_text_cache.clear()
+            self._preset_options_cache.clear()
+            self._preset_name_map = name_map
+            self._preset_names = names
+            self._default_preset_name = lower_index.get('default', names[0])
+            self._presets_source = presets
+        return self._preset_name_map, self._preset_names, self._default_preset_name
+    
+    def _invalidate_presets(self):
+        """清除预设缓存，在切换服务器或账号时调用"""
+        self._preset_name_map = None
+        self._preset_names = []
+        self._default_preset_name = ""
+        self._presets_source = None
+        self._preset_text_cache.clear()
+        self._preset_options_cache.clear()
+    
+    def _preset_details_text(self, preset: Dict[str, Any]) -> str:
+        """获取预设选项的展示文本，按预设ID缓存格式化结果
+        
+        Args:
+            preset: 预设信息
+        Returns:
+            str: 每行一个 "选项名 = 值" 的文本；预设没有选项列表时为空串
+        """
+        preset_id = preset.get('id')
+        text = self._preset_text_cache.get(preset_id)
+        if text is None:
+            options = preset.get('options')
+            if isinstance(options, list):
+                text = "".join(f"{opt.get('name')} = {opt.get('value')}\n" for opt in options)
+            else:
+                text = ""
+            self._preset_text_cache[preset_id] = text
+        return text
+    
+    def _preset_options(self, preset: Dict[str, Any]) -> Dict[str, Any]:
+        """获取预设的 {选项名: 值} 字典，按预设ID缓存
+        
+        Args:
+            preset: 预设信息
+        Returns:
+            Dict[str, Any]: 选项字典的副本，调用方可自由修改
+        """
+        preset_id = preset.get('id')
+        options = self._preset_options_cache.get(preset_id)
+        if options is None:
+            options = {
+                oname: opt.get('value')
+                for opt in preset.get('options') or []
+                if (oname := opt.get('name'))
+            }
+            self._preset_options_cache[preset_id] = options
+        return dict(options)
+    
+    def _get_progress_dialog(self, key: str, title: str):
+        """获取进度对话框，空闲时复用已创建的窗口，避免每次重新创建控件
+        
+        Args:
+            key: 对话框用途标识，如 'download'、'restart'
+            title: 对话框标题
+        Returns:
+            tuple: (对话框, 进度文本框, 关闭按钮)
+        """
+        cached = self._progress_dialogs.get(key)
+        if cached and cached[0].winfo_exists() and str(cached[2].cget("state")) != tk.DISABLED:
+            progress_dialog, progress_text, close_button = cached
+            progress_text.config(state="normal")
+            progress_text.delete("1.0", tk.END)
+            progress_text.config(state="disabled")
+            close_button.config(state=tk.DISABLED)
+            progress_dialog.title(title)
+            progress_dialog.deiconify()
+            progress_dialog.lift()
+            return cached
+        
+        progress_dialog = tk.Toplevel(self.root)
+        progress_dialog.title(title)
+        progress_dialog.geometry("400x300")
+        progress_dialog.transient(self.root)
+        # 关闭时仅隐藏窗口，以便下次复用
+        progress_dialog.protocol("WM_DELETE_WINDOW", progress_dialog.withdraw)
+        
+        progress_frame = ttk.Frame(progress_dialog, padding=10)
+        progress_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # 进度日志只读，由写入函数在插入时临时解除
+        progress_text = tk.Text(progress_frame, height=15, width=50, state="disabled")
+        progress_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        scrollbar = ttk.Scrollbar(progress_frame, command=progress_text.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        progress_text.config(yscrollcommand=scrollbar.set)
+        
+        close_button = ttk.Button(progress_dialog, text=t("close"), state=tk.DISABLED, command=progress_dialog.withdraw)
+        close_button.pack(pady=10)
+        
+        self._progress_dialogs[key] = (progress_dialog, progress_text, close_button)
+        return self._progress_dialogs[key]
+    
+    def _make_progress_writer(self, progress_text: tk.Text) -> Callable[[str], None]:
+        """创建可在工作线程中调用的进度文本写入函数
+        
+        消息先写入缓冲区，由主线程在下一次处理界面更新队列时合并为一次插入，避免逐行触发重绘。
+        
+        Args:
+            progress_text: 进度文本框
+        Returns:
+            Callable[[str], None]: 写入函数
+        """
+        buffer: Deque[str] = deque()
+        lock = threading.Lock()
+        pending = [False]
+        
+        def flush():
+            with lock:
+                pending[0] = False
+                chunks = [buffer.popleft() for _ in range(len(buffer))]
+            if chunks:
+                # 插入期间暂时断开滚动条回调，插入后再恢复并一次性滚动到底部
+                yscrollcommand = progress_text.cget("yscrollcommand")
+                progress_text.config(state="normal", yscrollcommand="")
+                progress_text.insert(tk.END, "".join(chunks))
+                line_count = int(progress_text.index("end-1c").split(".")[0])
+                if line_count > PROGRESS_MAX_LINES:
+                    progress_text.delete("1.0", f"{line_count - PROGRESS_MAX_LINES}.0")
+                progress_text.config(state="disabled", yscrollcommand=yscrollcommand)
+                progress_text.yview_moveto(1.0)
+        
+        def update_progress(text: str):
+            with lock:
+                buffer.append(text)
+                if pending[0]:
+                    return
+                pending[0] = True
+            self._post_ui(flush)
+        
+        return update_progress
+    
+    def _run_bulk_task_op(
+        self,
+        api_call: Callable[[Any, str], bool],
+        task_ids: List[str],
+        task_names: Optional[Dict[str, str]] = None,
+        on_start: Optional[Callable[[str, str], None]] = None,
+        on_result: Optional[Callable[[str, Optional[str], bool], None]] = None
+    ) -> int:
+        """在共享的API线程池中对多个任务并发执行同一操作，需在工作线程中调用
+        
+        WebODM 只提供逐个任务的 restart/cancel/remove 接口，没有批量接口，
+        因此批量操作通过并发的单任务请求完成。
+        
+        Args:
+            api_call: API操作，参数为(项目ID, 任务ID)，返回是否成功
+            task_ids: 任务ID列表
+            task_names: 已知的任务名称映射，缺失时通过一次任务列表请求补全
+            on_start: 每个任务开始操作前调用，参数为(任务ID, 任务名称)，在线程池线程中执行
+            on_result: 每个任务完成后调用，参数为(任务ID, 任务名称, 是否成功)
+        Returns:
+            int: 失败的任务数
+        """
+        project_id = self.current_project_id
+        known_names = dict(task_names or {})
+        missing_ids = [task_id for task_id in task_ids if not known_names.get(task_id)]
+        if missing_ids:
+            # 一次获取任务列表，代替逐个请求任务信息
+            for task_id, task in self.api.get_tasks_by_ids(project_id, missing_ids).items():
+                known_names[task_id] = task.get('name')
+        
+        get_name = known_names.get
+        
+        def run_one(task_id):
+            task_name = get_name(task_id) or f"task_{task_id}"
+            if on_start:
+                on_start(task_id, task_name)
+            return task_id, task_name, api_call(project_id, task_id)
+        
+        # 各任务的请求相互独立，提交到共享的API线程池并发执行
+        failed = 0
+        submit = self._api_executor.submit
+        futures = [submit(run_one, task_id) for task_id in task_ids]
+        for future in as_completed(futures):
+            task_id, task_name, success = future.result()
+            if not success:
+                failed += 1
+            if on_result:
+                on_result(task_id, task_name, success)
+        return failed
+    
+    def _flush_log(self, lines: List[str]):
+        """将累积的日志行一次性写入标准输出
+        
+        Args:
+            lines: 以换行结尾的日志行列表
+        """
+        # 打包为无控制台程序时 sys.stdout 可能为 None
+        if lines and sys.stdout:
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
+    
     def _sanitize_filename(self, name: str) -> str:
         """清理Windows路径非法字符，保证生成的文件名安全"""
-        safe = re.sub(r'[<>:"/\\|?*]', '_', str(name))
-        safe = safe.strip().strip('.')
-        if not safe:
-            safe = "task"
-        return safe[:150]
+        return _sanitize_cached(str(name))
 
     def _parse_bool_value(self, value: Any) -> bool:
         """将多种布尔表示转换为bool类型"""
         if isinstance(value, bool):
             return value
-        value_str = str(value).strip().lower()
-        if value_str in {"1", "true", "yes", "on"}:
-            return True
-        if value_str in {"0", "false", "no", "off", ""}:
-            return False
-        raise ValueError("Invalid boolean format")
+        result = _BOOL_VALUES.get(str(value).strip().lower())
+        if result is None:
+            raise ValueError("Invalid boolean format")
+        return result
 
     def _clean_option_values(self, options: Dict[str, Any]) -> Dict[str, Any]:
         """移除空字符串和None值，避免发送无效的处理选项"""
-        cleaned: Dict[str, Any] = {}
-        for key, value in options.items():
-            if value is None:
-                continue
-            if isinstance(value, str):
-                trimmed = value.strip()
-                if not trimmed:
+        # 非字符串值直接保留，只有字符串才需要调用清理函数
+        return {
+            key: cleaned
+            for key, value in options.items()
+            if (cleaned := (_clean_option_str(value) if isinstance(value, str) else value)) is not None
+        }
+    
+    def _patch_task_rows(self, project_id: Any, changes: Dict[str, Optional[int]]):
+        """根据操作结果只更新任务表格中受影响的行，避免重新获取整个任务列表
+        
+        变化的任务超过 TASK_PATCH_MAX_RATIO 比例时改为完整重新加载。
+        
+        Args:
+            project_id: 操作所属的项目ID，与当前项目不一致时忽略
+            changes: {任务ID: 新状态码}，状态码为None表示任务已删除
+        """
+        if not changes or project_id != self.current_project_id:
+            return
+        tasks = self.tasks_data
+        if len(changes) > len(tasks) * TASK_PATCH_MAX_RATIO:
+            self.load_tasks()
+            return
+        
+        status_map = get_status_map()
+        status_unknown = status_map[STATUS_UNKNOWN_KEY]
+        treeview = self.tasks_treeview
+        iid_to_task_id = self._iid_to_task_id
+        set_cell = treeview.set
+        with _batch_update(treeview):
+            for iid, task_id in list(iid_to_task_id.items()):
+                if task_id not in changes:
                     continue
-                if trimmed.lower() in {"none", "null"}:
+                status = changes[task_id]
+                if status is None:
+                    treeview.delete(iid)
+                    del iid_to_task_id[iid]
                     continue
-                cleaned[key] = trimmed
-            else:
-                cleaned[key] = value
-        return cleaned
+                # 只写入状态两列；整行读回再写入会让 Tk 把 "007" 之类的名称转换成整数
+                set_cell(iid, "status", status_map.get(status, status_unknown))
+                set_cell(iid, "status_code", status)
+        
+        # 同步任务数据，使用新列表和新字典，不修改API返回的原对象
+        patched = []
+        for task in tasks:
+            task_id = str(task.get('id', ""))
+            if task_id not in changes:
+                patched.append(task)
+            elif changes[task_id] is not None:
+                patched.append({**task, 'status': changes[task_id]})
+        self.tasks_data = patched
+        self._tasks_by_id = {str(task.get('id', "")): task for task in patched}
     
-    def restart_tasks(self):
-        """重启选中的任务"""
+    def _validate_selection(self) -> Optional[List[Tuple[str, tuple]]]:
+        """检查登录状态、当前项目及任务选择，校验失败时弹出错误提示
+        
+        Returns:
+            Optional[List[Tuple[str, tuple]]]: 选中行的 (任务ID, 行数据) 列表；校验失败时为None
+        """
         if not self.api.token:
             messagebox.showerror(t("error"), t("error_not_logged_in"))
-            return
+            return None
         
         if not self.current_project_id:
             messagebox.showerror(t("error"), t("error_no_project_selected"))
-            return
+            return None
         
-        # 获取选中的任务
         selection = self.tasks_treeview.selection()
         if not selection:
             messagebox.showerror(t("error"), t("error_no_task_selected"))
+            return None
+        
+        # 一次遍历选中行，同时取出任务ID和行数据
+        tv_item = self.tasks_treeview.item
+        iid_to_task_id = self._iid_to_task_id
+        return [(iid_to_task_id[item], tv_item(item, "values")) for item in selection]
+    
+    def restart_tasks(self):
+        """重启选中的任务"""
+        rows = self._validate_selection()
+        if rows is None:
             return
         
-        # 获取任务ID列表
-        task_ids = []
-        for item in selection:
-            task_id = self.tasks_treeview.item(item, "values")[0]
-            task_ids.append(task_id)
+        # 获取任务ID列表及名称
+        name_col = self.TASK_COL_NAME
+        task_names = {task_id: str(values[name_col]) for task_id, values in rows}
+        task_ids = list(task_names)
         
         # 如果只选择了一个任务，使用单个任务的重启方法
         if len(task_ids) == 1:
             self.restart_task(task_ids[0])
             return
         
-        # 获取预设
-        self.status_var.set(t("getting_presets"))
-        presets = self.api.get_presets()
-        if not presets:
-            messagebox.showerror(t("error"), t("get_presets_failed"))
-            self.status_var.set(t("ready"))
-            return
-
-        # 创建重启选项对话框（预设选择）
-        restart_dialog = tk.Toplevel(self.root)
-        restart_dialog.title(t("batch_restart_title"))
-        restart_dialog.geometry("500x400")
-        restart_dialog.transient(self.root)
-        restart_dialog.grab_set()
-
-        main_frame = ttk.Frame(restart_dialog)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        ttk.Label(main_frame, text=t("will_restart_tasks", count=len(task_ids)), font=("TkDefaultFont", 10, "bold")).pack(pady=(0, 10), anchor=tk.W)
-
-        preset_name_map = {p.get('name', f"preset_{p.get('id')}"): p for p in presets}
-        preset_names = list(preset_name_map.keys())
-        default_preset_name = next((name for name in preset_names if name.lower() == 'default'), preset_names[0])
-
-        selected_preset_var = tk.StringVar(value=default_preset_name)
-        selector_frame = ttk.Frame(main_frame)
-        selector_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(selector_frame, text=t("preset")).pack(side=tk.LEFT, padx=(0, 5))
-        preset_select = ttk.Combobox(selector_frame, textvariable=selected_preset_var, values=preset_names, state="readonly", width=30)
-        preset_select.pack(side=tk.LEFT)
-
-        details_group = ttk.LabelFrame(main_frame, text=t("preset_options_readonly"))
-        details_group.pack(fill=tk.BOTH, expand=True, pady=10)
-        details_text = tk.Text(details_group, height=10, width=60)
-        details_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-        def render_details():
-            details_text.config(state="normal")
-            details_text.delete("1.0", tk.END)
-            preset = preset_name_map.get(selected_preset_var.get())
-            if preset and isinstance(preset.get('options'), list):
-                for opt in preset['options']:
-                    details_text.insert(tk.END, f"{opt.get('name')} = {opt.get('value')}\n")
-            details_text.config(state="disabled")
-
-        preset_select.bind("<<ComboboxSelected>>", lambda e: render_details())
-        render_details()
-
-        button_frame = ttk.Frame(restart_dialog)
-        button_frame.pack(fill=tk.X, pady=10)
-
-        def do_restart():
-            preset = preset_name_map.get(selected_preset_var.get())
-            if not preset:
-                messagebox.showerror(t("error"), t("error_invalid_preset"))
-                return
-            options = {}
-            for opt in preset.get('options', []):
-                name = opt.get('name')
-                if not name:
-                    continue
-                options[name] = opt.get('value')
-            restart_dialog.destroy()
-            self.start_restart_tasks(task_ids, options)
-
-        ttk.Button(button_frame, text=t("cancel"), command=restart_dialog.destroy).pack(side=tk.RIGHT, padx=5)
-        ttk.Button(button_frame, text=t("restart_tasks"), command=do_restart).pack(side=tk.RIGHT)
+        self._show_preset_dialog(
+            t("batch_restart_title"),
+            t("will_restart_tasks", count=len(task_ids)),
+            t("restart_tasks"),
+            lambda options: self.start_restart_tasks(task_ids, options, task_names)
+        )
     
-    def start_restart_tasks(self, task_ids: List[Union[int, str]], options: Optional[Dict[str, Any]]):
+    def start_restart_tasks(
+        self,
+        task_ids: List[str],
+        options: Optional[Dict[str, Any]],
+        task_names: Optional[Dict[str, str]] = None
+    ):
         """开始重启任务
         
         Args:
             task_ids: 任务ID列表
             options: 处理选项字典
+            task_names: 已知的任务名称映射（可选），缺失的名称会向服务器查询
         """
         self.status_var.set(t("restarting_tasks"))
-        self.root.config(cursor="wait")
+        self._set_busy(True)
         
-        # 创建进度对话框
-        progress_dialog = tk.Toplevel(self.root)
-        progress_dialog.title(t("restart_progress"))
-        progress_dialog.geometry("400x300")
-        progress_dialog.transient(self.root)
-        
-        # 创建进度文本框
-        progress_frame = ttk.Frame(progress_dialog, padding=10)
-        progress_frame.pack(fill=tk.BOTH, expand=True)
-        
-        progress_text = tk.Text(progress_frame, height=15, width=50)
-        progress_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        scrollbar = ttk.Scrollbar(progress_frame, command=progress_text.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        progress_text.config(yscrollcommand=scrollbar.set)
-        
-        # 添加关闭按钮
-        close_button = ttk.Button(progress_dialog, text=t("close"), state=tk.DISABLED)
-        close_button.pack(pady=10)
+        # 获取进度对话框
+        progress_dialog, progress_text, close_button = self._get_progress_dialog("restart", t("restart_progress"))
         
         # 重启线程
         def restart_thread():
             total_tasks = len(task_ids)
             completed_tasks = 0
-            failed_tasks = 0
+            project_id = self.current_project_id
+            changes: Dict[str, Optional[int]] = {}
+            restart_options = options or {}
+            restart = self.api.restart_task
+            # 循环外取一次翻译模板，逐个任务只做格式化
+            L = self.i18n.batch(('restarting_task', 'restart_success', 'restart_failed'))
+            fmt_restarting = L['restarting_task'] + "\n"
+            fmt_success = L['restart_success'] + "\n"
+            fmt_failed = L['restart_failed'] + "\n"
             
-            for task_id in task_ids:
-                # 获取任务信息
-                task_info = self.api.get_task(self.current_project_id, task_id)
-                if not task_info:
-                    update_progress(f"{t('error_no_task_info', task_id=task_id)}\n")
-                    failed_tasks += 1
-                    completed_tasks += 1
-                    update_progress_title(completed_tasks, total_tasks)
-                    continue
-                
-                task_name = task_info.get('name', f"task_{task_id}")
-                
-                update_progress(f"{t('restarting_task', task_id=task_id, task_name=task_name)}\n")
-                
-                restart_options = options or {}
-                success = self.api.restart_task(self.current_project_id, task_id, restart_options)
-                
+            def on_start(task_id, task_name):
+                update_progress(fmt_restarting.format(task_id=task_id, task_name=task_name))
+            
+            def on_result(task_id, task_name, success):
+                nonlocal completed_tasks
+                fmt = fmt_success if success else fmt_failed
+                update_progress(fmt.format(task_id=task_id, task_name=task_name))
                 if success:
-                    update_progress(f"{t('restart_success', task_id=task_id, task_name=task_name)}\n")
-                else:
-                    update_progress(f"{t('restart_failed', task_id=task_id, task_name=task_name)}\n")
-                    failed_tasks += 1
-                
+                    changes[task_id] = STATUS_QUEUED
                 completed_tasks += 1
                 update_progress_title(completed_tasks, total_tasks)
             
-            # 完成重启
-            update_progress(f"\n{t('restart_complete', total=total_tasks, success=total_tasks - failed_tasks, failed=failed_tasks)}\n")
-            self.root.after(0, lambda: self.root.config(cursor=""))
-            self.root.after(0, lambda: self.status_var.set(t("restart_complete_status")))
-            self.root.after(0, lambda: close_button.config(state=tk.NORMAL, command=progress_dialog.destroy))
+            status = t("ready")
+            try:
+                failed_tasks = self._run_bulk_task_op(
+                    lambda project_id, task_id: restart(project_id, task_id, restart_options),
+                    task_ids,
+                    task_names,
+                    on_start=on_start,
+                    on_result=on_result
+                )
+                
+                # 完成重启
+                update_progress(f"\n{t('restart_complete', total=total_tasks, success=total_tasks - failed_tasks, failed=failed_tasks)}\n")
+                status = t("restart_complete_status")
+            finally:
+                self._post_ui(self._end_action, status)
+                self._post_ui(close_button.config, {"state": tk.NORMAL})
             
-            # 重新加载任务列表
-            self.root.after(1000, self.load_tasks)
+            # 只更新重启成功的任务行
+            self._post_ui(self._patch_task_rows, project_id, changes)
         
         # 更新进度文本
-        def update_progress(text):
-            self.root.after(0, lambda: progress_text.insert(tk.END, text))
-            self.root.after(0, lambda: progress_text.see(tk.END))
+        update_progress = self._make_progress_writer(progress_text)
         
         # 更新进度对话框标题
+        title_prefix = t('restart_progress')
+        
         def update_progress_title(completed, total):
-            self.root.after(0, lambda: progress_dialog.title(f"{t('restart_progress')} ({completed}/{total})"))
+            # 大批量时每完成约1%才更新一次标题
+            if completed != total and completed % max(1, total // 100):
+                return
+            self._post_ui(progress_dialog.title, f"{title_prefix} ({completed}/{total})")
         
         # 启动重启线程
-        threading.Thread(target=restart_thread).start()
+        self._executor.submit(restart_thread)
     
     def cancel_tasks(self):
         """取消选中的任务"""
-        if not self.api.token:
-            messagebox.showerror(t("error"), t("error_not_logged_in"))
-            return
-        
-        if not self.current_project_id:
-            messagebox.showerror(t("error"), t("error_no_project_selected"))
-            return
-        
-        # 获取选中的任务
-        selection = self.tasks_treeview.selection()
-        if not selection:
-            messagebox.showerror(t("error"), t("error_no_task_selected"))
+        rows = self._validate_selection()
+        if rows is None:
             return
         
-        # 获取任务ID列表和检查是否有已完成的任务
-        task_ids = []
-        completed_tasks = []
-        status_completed = t("status_completed")
-        
-        for item in selection:
-            values = self.tasks_treeview.item(item, "values")
-            task_id = values[0]
-            task_status = values[3]  # 状态在第4列
-            
-            if task_status == status_completed:  # 状态40对应"已完成"
+        # 获取任务ID列表和检查是否有已完成的任务，按隐藏列中的状态码判断
+        status_code_col = self.TASK_COL_STATUS_CODE
+        name_col = self.TASK_COL_NAME
+        completed_tasks: List[str] = []
+        task_names: Dict[str, str] = {}
+        for task_id, values in rows:
+            if int(values[status_code_col]) == STATUS_COMPLETED:
                 completed_tasks.append(task_id)
             else:
-                task_ids.append(task_id)
+                task_names[task_id] = str(values[name_col])
+        task_ids = list(task_names)
         
         # 如果所有选中的任务都已完成，显示错误消息
         if not task_ids and completed_tasks:
             messagebox.showerror(t("error"), t("error_completed_tasks"))
             return
         
-        # 如果有部分任务已完成，提示用户
-        if completed_tasks:
-            if not messagebox.askyesno(t("warning"), t("warning_completed_tasks", completed=len(completed_tasks), remaining=len(task_ids))):
-                return
-        
         # 如果没有可取消的任务，直接返回
         if not task_ids:
             return
         
-        # 确认取消
-        if not messagebox.askyesno(t("confirm"), t("confirm_cancel", count=len(task_ids))):
+        # 确认取消；有部分任务已完成时，该提示本身即为确认
+        if completed_tasks:
+            confirmed = messagebox.askyesno(t("warning"), t("warning_completed_tasks", completed=len(completed_tasks), remaining=len(task_ids)))
+        else:
+            confirmed = messagebox.askyesno(t("confirm"), t("confirm_cancel", count=len(task_ids)))
+        if not confirmed:
             return
         
         self.status_var.set(t("canceling_tasks"))
-        self.root.config(cursor="wait")
+        self._set_busy(True)
         
         # 取消任务线程
         def cancel_thread():
             total_tasks = len(task_ids)
-            completed_tasks = 0
-            failed_tasks = 0
+            project_id = self.current_project_id
+            changes: Dict[str, Optional[int]] = {}
+            log: List[str] = []
             
-            for task_id in task_ids:
-                # 获取任务信息
-                task_info = self.api.get_task(self.current_project_id, task_id)
-                if not task_info:
-                    print(f"Unable to get task {task_id} info")
-                    failed_tasks += 1
-                    completed_tasks += 1
-                    continue
-                
-                task_name = task_info.get('name', f"task_{task_id}")
-                
-                print(f"Canceling task {task_id} ({task_name})...")
-                
-                success = self.api.cancel_task(self.current_project_id, task_id)
-                
+            def on_start(task_id, task_name):
+                log.append(f"Canceling task {task_id} ({task_name})...\n")
+            
+            def on_result(task_id, task_name, success):
                 if success:
-                    print(f"Successfully canceled task {task_id} ({task_name})")
+                    changes[task_id] = STATUS_CANCELED
+                    log.append(f"Successfully canceled task {task_id} ({task_name})\n")
                 else:
-                    print(f"Failed to cancel task {task_id} ({task_name})")
-                    failed_tasks += 1
-                
-                completed_tasks += 1
+                    log.append(f"Failed to cancel task {task_id} ({task_name})\n")
             
-            # 完成取消
-            self.root.after(0, lambda: self.root.config(cursor=""))
-            self.root.after(0, lambda: self.status_var.set(t("cancel_complete", total=total_tasks, success=total_tasks - failed_tasks, failed=failed_tasks)))
+            status = t("ready")
+            try:
+                failed_tasks = self._run_bulk_task_op(self.api.cancel_task, task_ids, task_names, on_start, on_result)
+                self._flush_log(log)
+                status = t("cancel_complete", total=total_tasks, success=total_tasks - failed_tasks, failed=failed_tasks)
+            finally:
+                # 完成取消
+                self._post_ui(self._end_action, status)
             
-            # 重新加载任务列表
-            self.root.after(1000, self.load_tasks)
+            # 只更新取消成功的任务行
+            self._post_ui(self._patch_task_rows, project_id, changes)
         
         # 启动取消线程
-        threading.Thread(target=cancel_thread).start()
+        self._executor.submit(cancel_thread)
     
     def remove_tasks(self):
         """删除选中的任务"""
-        if not self.api.token:
-            messagebox.showerror(t("error"), t("error_not_logged_in"))
+        rows = self._validate_selection()
+        if rows is None:
             return
         
-        if not self.current_project_id:
-            messagebox.showerror(t("error"), t("error_no_project_selected"))
-            return
-        
-        # 获取选中的任务
-        selection = self.tasks_treeview.selection()
-        if not selection:
-            messagebox.showerror(t("error"), t("error_no_task_selected"))
-            return
-        
-        # 获取任务ID列表
-        task_ids = []
-        for item in selection:
-            task_id = self.tasks_treeview.item(item, "values")[0]
-            task_ids.append(task_id)
+        # 获取任务ID列表及名称
+        name_col = self.TASK_COL_NAME
+        task_names = {task_id: str(values[name_col]) for task_id, values in rows}
+        task_ids = list(task_names)
         
         # 确认删除
         if not messagebox.askyesno(t("confirm"), t("confirm_delete", count=len(task_ids)), icon=messagebox.WARNING):
             return
         
         self.status_var.set(t("deleting_tasks"))
-        self.root.config(cursor="wait")
+        self._set_busy(True)
         
         # 删除任务线程
         def remove_thread():
             total_tasks = len(task_ids)
-            completed_tasks = 0
-            failed_tasks = 0
+            project_id = self.current_project_id
+            changes: Dict[str, Optional[int]] = {}
+            log: List[str] = []
             
-            for task_id in task_ids:
-                # 获取任务信息
-                task_info = self.api.get_task(self.current_project_id, task_id)
-                if not task_info:
-                    print(f"Unable to get task {task_id} info")
-                    failed_tasks += 1
-                    completed_tasks += 1
-                    continue
-                
-                task_name = task_info.get('name', f"task_{task_id}")
-                
-                print(f"Deleting task {task_id} ({task_name})...")
-                
-                success = self.api.remove_task(self.current_project_id, task_id)
-                
+            def on_start(task_id, task_name):
+                log.append(f"Deleting task {task_id} ({task_name})...\n")
+            
+            def on_result(task_id, task_name, success):
                 if success:
-                    print(f"Successfully deleted task {task_id} ({task_name})")
+                    changes[task_id] = None
+                    log.append(f"Successfully deleted task {task_id} ({task_name})\n")
                 else:
-                    print(f"Failed to delete task {task_id} ({task_name})")
-                    failed_tasks += 1
-                
-                completed_tasks += 1
+                    log.append(f"Failed to delete task {task_id} ({task_name})\n")
             
-            # 完成删除
-            self.root.after(0, lambda: self.root.config(cursor=""))
-            self.root.after(0, lambda: self.status_var.set(t("delete_complete", total=total_tasks, success=total_tasks - failed_tasks, failed=failed_tasks)))
+            status = t("ready")
+            try:
+                failed_tasks = self._run_bulk_task_op(self.api.remove_task, task_ids, task_names, on_start, on_result)
+                self._flush_log(log)
+                status = t("delete_complete", total=total_tasks, success=total_tasks - failed_tasks, failed=failed_tasks)
+            finally:
+                # 完成删除
+                self._post_ui(self._end_action, status)
             
-            # 重新加载任务列表
-            self.root.after(1000, self.load_tasks)
+            # 只移除删除成功的任务行
+            self._post_ui(self._patch_task_rows, project_id, changes)
         
         # 启动删除线程
-        threading.Thread(target=remove_thread).start()
+        self._executor.submit(remove_thread)
     
             
     def restart_task(self, task_id):
@@ -1795,44 +2475,104 @@ class WebODMClientUI:
             messagebox.showerror(t("error"), t("error_no_project_selected"))
             return
         
-        # 获取任务信息
-        task_info = self.api.get_task(self.current_project_id, task_id)
+        # 获取任务信息，优先使用已加载的任务列表，避免额外请求
+        task_info = self._tasks_by_id.get(str(task_id)) or self.api.get_task(self.current_project_id, task_id)
         if not task_info:
             messagebox.showerror(t("error"), t("error_no_task_info", task_id=task_id))
             return
         
         task_name = task_info.get('name', f"task_{task_id}")
-        current_options = task_info.get('options', [])
         
-        # 获取预设
+        def do_restart(options: Dict[str, Any]):
+            self.status_var.set(t("restarting_task", task_id=task_id, task_name=task_name))
+            self._set_busy(True)
+
+            def restart_thread():
+                project_id = self.current_project_id
+                success = False
+                try:
+                    success = self.api.restart_task(project_id, task_id, options)
+                finally:
+                    status = t("restart_success" if success else "restart_failed", task_id=task_id, task_name=task_name)
+                    self._post_ui(self._end_action, status)
+                if success:
+                    self._post_ui(self._patch_task_rows, project_id, {str(task_id): STATUS_QUEUED})
+                else:
+                    self._post_ui(messagebox.showerror, t("error"), status)
+
+            self._executor.submit(restart_thread)
+
+        self._show_preset_dialog(
+            f"{t('restart_task_title')} - {task_name} (ID: {task_id})",
+            t("select_preset"),
+            t("restart"),
+            do_restart
+        )
+    
+    def _show_preset_dialog(
+        self,
+        title: str,
+        header: str,
+        ok_label: str,
+        on_ok: Callable[[Dict[str, Any]], None]
+    ):
+        """显示预设选择对话框，窗口首次创建后隐藏复用
+        
+        Args:
+            title: 对话框标题
+            header: 对话框顶部的说明文字
+            ok_label: 确认按钮文字
+            on_ok: 确认后调用，参数为所选预设的处理选项字典
+        """
         self.status_var.set(t("getting_presets"))
-        presets = self.api.get_presets()
-        if not presets:
+        preset_name_map, preset_names, default_preset_name = self._get_preset_map()
+        if not preset_names:
             messagebox.showerror(t("error"), t("get_presets_failed"))
             self.status_var.set(t("ready"))
             return
+        
+        dialog = self._preset_dialog
+        if dialog is None or not dialog['window'].winfo_exists():
+            dialog = self._build_preset_dialog()
+        
+        window = dialog['window']
+        window.title(title)
+        dialog['header'].config(text=header)
+        dialog['ok_button'].config(text=ok_label)
+        # 预设列表未变化时无需重新设置下拉框
+        if dialog['names'] is not preset_names:
+            dialog['select'].config(values=preset_names)
+            dialog['names'] = preset_names
+        dialog['name_map'] = preset_name_map
+        dialog['on_ok'] = on_ok
+        dialog['preset_var'].set(default_preset_name)
+        dialog['render']()
+        
+        window.deiconify()
+        window.lift()
+        window.grab_set()
+    
+    def _build_preset_dialog(self) -> Dict[str, Any]:
+        """创建预设选择对话框的控件，关闭时仅隐藏以便复用
+        
+        Returns:
+            Dict[str, Any]: 对话框控件及状态
+        """
+        preset_dialog = tk.Toplevel(self.root)
+        preset_dialog.geometry("500x400")
+        preset_dialog.transient(self.root)
 
-        # 创建重启任务对话框（预设选择）
-        restart_dialog = tk.Toplevel(self.root)
-        restart_dialog.title(f"{t('restart_task_title')} - {task_name} (ID: {task_id})")
-        restart_dialog.geometry("500x400")
-        restart_dialog.transient(self.root)
-        restart_dialog.grab_set()
-
-        main_frame = ttk.Frame(restart_dialog)
+        main_frame = ttk.Frame(preset_dialog)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        ttk.Label(main_frame, text=t("select_preset"), font=("TkDefaultFont", 10, "bold")).pack(pady=(0, 10), anchor=tk.W)
-
-        preset_name_map = {p.get('name', f"preset_{p.get('id')}"): p for p in presets}
-        preset_names = list(preset_name_map.keys())
-        default_preset_name = next((name for name in preset_names if name.lower() == 'default'), preset_names[0])
+        header_label = ttk.Label(main_frame, font=("TkDefaultFont", 10, "bold"))
+        header_label.pack(pady=(0, 10), anchor=tk.W)
 
-        selected_preset_var = tk.StringVar(value=default_preset_name)
+        selected_preset_var = tk.StringVar()
         selector_frame = ttk.Frame(main_frame)
         selector_frame.pack(fill=tk.X, pady=5)
         ttk.Label(selector_frame, text=t("preset")).pack(side=tk.LEFT, padx=(0, 5))
-        preset_select = ttk.Combobox(selector_frame, textvariable=selected_preset_var, values=preset_names, state="readonly", width=30)
+        preset_select = ttk.Combobox(selector_frame, textvariable=selected_preset_var, state="readonly", width=30)
         preset_select.pack(side=tk.LEFT)
 
         details_group = ttk.LabelFrame(main_frame, text=t("preset_options_readonly"))
@@ -1840,48 +2580,52 @@ class WebODMClientUI:
         details_text = tk.Text(details_group, height=10, width=60)
         details_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        def render_details():
+        dialog: Dict[str, Any] = {
+            'window': preset_dialog,
+            'header': header_label,
+            'select': preset_select,
+            'preset_var': selected_preset_var,
+            'names': None,
+            'name_map': {},
+            'preset': None,
+            'on_ok': None,
+        }
+
+        def render_details(event=None):
+            # 当前选中的预设，与上次渲染的相同时不再重绘
+            preset = dialog['name_map'].get(selected_preset_var.get())
+            if preset is dialog['preset']:
+                return
+            dialog['preset'] = preset
             details_text.config(state="normal")
             details_text.delete("1.0", tk.END)
-            preset = preset_name_map.get(selected_preset_var.get())
-            if preset and isinstance(preset.get('options'), list):
-                for opt in preset['options']:
-                    details_text.insert(tk.END, f"{opt.get('name')} = {opt.get('value')}\n")
+            if preset:
+                details_text.insert(tk.END, self._preset_details_text(preset))
             details_text.config(state="disabled")
 
-        preset_select.bind("<<ComboboxSelected>>", lambda e: render_details())
-        render_details()
+        def hide():
+            preset_dialog.grab_release()
+            preset_dialog.withdraw()
 
-        button_frame = ttk.Frame(restart_dialog)
-        button_frame.pack(fill=tk.X, pady=10)
-
-        def do_restart():
-            preset = preset_name_map.get(selected_preset_var.get())
+        def do_ok():
+            preset = dialog['preset']
             if not preset:
                 messagebox.showerror(t("error"), t("error_invalid_preset"))
                 return
-            options = {}
-            for opt in preset.get('options', []):
-                name = opt.get('name')
-                if not name:
-                    continue
-                options[name] = opt.get('value')
-            restart_dialog.destroy()
+            options = self._preset_options(preset)
+            hide()
+            dialog['on_ok'](options)
 
-            self.status_var.set(t("restarting_task", task_id=task_id, task_name=task_name))
-            self.root.config(cursor="wait")
-
-            def restart_thread():
-                success = self.api.restart_task(self.current_project_id, task_id, options)
-                if success:
-                    self.root.after(0, lambda: self.status_var.set(t("restart_success", task_id=task_id, task_name=task_name)))
-                    self.root.after(0, lambda: self.load_tasks())
-                else:
-                    self.root.after(0, lambda: self.status_var.set(t("restart_failed", task_id=task_id, task_name=task_name)))
-                    self.root.after(0, lambda: messagebox.showerror(t("error"), t("restart_failed", task_id=task_id, task_name=task_name)))
-                self.root.after(0, lambda: self.root.config(cursor=""))
+        preset_select.bind("<<ComboboxSelected>>", render_details)
+        preset_dialog.protocol("WM_DELETE_WINDOW", hide)
 
-            threading.Thread(target=restart_thread).start()
+        button_frame = ttk.Frame(preset_dialog)
+        button_frame.pack(fill=tk.X, pady=10)
+        ok_button = ttk.Button(button_frame, command=do_ok)
+        ok_button.pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text=t("cancel"), command=hide).pack(side=tk.RIGHT, padx=5)
 
-        ttk.Button(button_frame, text=t("restart"), command=do_restart).pack(side=tk.RIGHT, padx=5)
-        ttk.Button(button_frame, text=t("cancel"), command=restart_dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        dialog['ok_button'] = ok_button
+        dialog['render'] = render_details
+        self._preset_dialog = dialog
+        return dialog